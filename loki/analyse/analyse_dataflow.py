@@ -10,7 +10,9 @@ Collection of dataflow analysis schema routines.
 """
 
 from contextlib import contextmanager
-from loki.expression import FindVariables, Array, FindInlineCalls
+from loki.expression import (
+    FindVariables, Array, Scalar, DeferredTypeSymbol, InlineCall, ExpressionFinder, ExpressionRetriever
+)
 from loki.tools import as_tuple, flatten
 from loki.types import BasicType
 from loki.visitors import Visitor, Transformer
@@ -23,6 +25,16 @@ __all__ = [
 ]
 
 
+class FindVariablesAndInlineCalls(ExpressionFinder):
+    """
+    A visitor to collect all variables and :any:`InlineCall` symbols used in an
+    IR tree in a single traversal.
+
+    See :class:`ExpressionFinder`
+    """
+    retriever = ExpressionRetriever(lambda e: isinstance(e, (Scalar, Array, DeferredTypeSymbol, InlineCall)))
+
+
 class DataflowAnalysisAttacher(Transformer):
     """
     Analyse and attach in-place the definition, use and live status of
@@ -64,6 +76,17 @@ class DataflowAnalysisAttacher(Transformer):
             return {v.clone(dimensions=None) for v in FindVariables().visit(expr) if condition(v)}
         return {v.clone(dimensions=None) for v in FindVariables().visit(expr)}
 
+    @classmethod
+    def _symbols_from_rhs_expr(cls, expr):
+        """
+        Return set of variables read in an expression, excluding arguments to
+        functions that just check the memory attributes of a variable.
+        """
+        exprs = FindVariablesAndInlineCalls(unique=False).visit(expr)
+        mem_calls = [e for e in exprs if isinstance(e, InlineCall) and e.function in cls._mem_property_queries]
+        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
+        return set(v for v in exprs if not (isinstance(v, InlineCall) or v in query_args))
+
     @classmethod
     def _symbols_from_lhs_expr(cls, expr):
         """
@@ -152,9 +175,7 @@ class DataflowAnalysisAttacher(Transformer):
         live = kwargs.pop('live_symbols', set())
 
         # exclude arguments to functions that just check the memory attributes of a variable
-        mem_call = as_tuple(i for i in FindInlineCalls().visit(o.condition) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_call))
-        cset = set(v for v in FindVariables().visit(o.condition) if not v in query_args)
+        cset = self._symbols_from_rhs_expr(o.condition)
 
         condition = self._symbols_from_expr(as_tuple(cset))
         body, defines, uses = self._visit_body(o.body, live=live, uses=condition, **kwargs)
@@ -166,13 +187,9 @@ class DataflowAnalysisAttacher(Transformer):
         live = kwargs.pop('live_symbols', set())
 
         # exclude arguments to functions that just check the memory attributes of a variable
-        mem_calls = as_tuple(i for i in FindInlineCalls().visit(o.expr) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
-        eset = set(v for v in FindVariables().visit(o.expr) if not v in query_args)
+        eset = self._symbols_from_rhs_expr(o.expr)
 
-        mem_calls = as_tuple(i for i in FindInlineCalls().visit(o.values) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
-        vset = set(v for v in FindVariables().visit(o.values) if not v in query_args)
+        vset = self._symbols_from_rhs_expr(o.values)
 
         uses = self._symbols_from_expr(as_tuple(eset)) | self._symbols_from_expr(as_tuple(vset))
         body = ()
@@ -199,9 +216,7 @@ class DataflowAnalysisAttacher(Transformer):
 
     def visit_Assignment(self, o, **kwargs):
         # exclude arguments to functions that just check the memory attributes of a variable
-        mem_calls = as_tuple(i for i in FindInlineCalls().visit(o.rhs) if i.function in self._mem_property_queries)
-        query_args = as_tuple(flatten(FindVariables().visit(i.parameters) for i in mem_calls))
-        rset = set(v for v in FindVariables().visit(o.rhs) if not v in query_args)
+        rset = self._symbols_from_rhs_expr(o.rhs)
 
         # The left-hand side variable is defined by this statement
         defines, uses = self._symbols_from_lhs_expr(o.lhs)
@@ -11,3 +11,4 @@ from loki.backend.maxgen import * # noqa
 from loki.backend.pygen import * # noqa
 from loki.backend.dacegen import * # noqa
 from loki.backend.cufgen import * # noqa
+from loki.backend.util import * # noqa
@@ -5,6 +5,8 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from itertools import chain
+
 from loki.backend.fgen import FortranCodegen
 
 __all__ = ['cufgen', 'CudaFortranCodegen']
@@ -25,13 +27,14 @@ class CudaFortranCodegen(FortranCodegen):
         """
         pragma = self.visit(o.pragma, **kwargs)
         name = self.visit(o.name, **kwargs)
-        args = self.visit_all(o.arguments, **kwargs)
+        args = chain(
+            self.visit_all(o.arguments, **kwargs),
+            (f'{self.visit(kw, **kwargs)}={self.visit(arg, **kwargs)}' for kw, arg in o.kwarguments or ())
+        )
         if o.chevron is not None:
-            chevron = f"<<<{','.join([str(elem) for elem in o.chevron])}>>>"
+            chevron = f"<<<{','.join(map(str, o.chevron))}>>>"
         else:
             chevron = ""
-        if o.kwarguments:
-            args += tuple(f'{self.visit(arg[0], **kwargs)}={self.visit(arg[1], **kwargs)}' for arg in o.kwarguments)
         call = self.format_line('CALL ', name, chevron, '(', self.join_items(args), ')')
         return self.join_lines(pragma, call)
 
@@ -52,8 +55,9 @@ class CudaFortranCodegen(FortranCodegen):
             "texture": "TEXTURE"
                     }
 
+        attrs = vars(o)
         for key, value in attr_dic.items():
-            if getattr(o, key):
+            if attrs.get(key):
                 attributes += [value]
 
         return self.join_items([attr_str] + attributes)
@@ -6,6 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from loki.backend.pygen import PyCodegen
+from loki.backend.util import lookup_backend_type
 from loki.expression import symbols as sym, ExpressionRetriever
 from loki.pragma_utils import is_loki_pragma
 from loki.types import BasicType
@@ -13,16 +14,20 @@ from loki.types import BasicType
 __all__ = ['dacegen', 'DaceCodegen']
 
 
+_DACE_TYPES = {
+    (BasicType.LOGICAL, None): 'dace.bool',
+    (BasicType.INTEGER, None): 'dace.int32',
+    (BasicType.REAL, 'real32'): 'dace.float32',
+    (BasicType.REAL, None): 'dace.float64',
+}
+"""
+Map of ``(dtype, kind)`` to the corresponding Dace type,
+with ``kind=None`` as the fallback for each :any:`BasicType`
+"""
+
+
 def dace_type(_type):
-    if _type.dtype == BasicType.LOGICAL:
-        return 'dace.bool'
-    if _type.dtype == BasicType.INTEGER:
-        return 'dace.int32'
-    if _type.dtype == BasicType.REAL:
-        if str(_type.kind) in ('real32',):
-            return 'dace.float32'
-        return 'dace.float64'
-    raise ValueError(str(_type))
+    return lookup_backend_type(_DACE_TYPES, _type)
 
 
 class DaceCodegen(PyCodegen):
@@ -5,6 +5,8 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from itertools import chain
+
 from pymbolic.mapper.stringifier import (
     PREC_UNARY, PREC_LOGICAL_AND, PREC_LOGICAL_OR, PREC_COMPARISON, PREC_NONE
 )
@@ -36,6 +38,10 @@ class FCodeMapper(LokiStringifyMapper):
         ">": r">",
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._type_codegen = None
+
     def map_logic_literal(self, expr, enclosing_prec, *args, **kwargs):
         return '.true.' if expr.value else '.false.'
 
@@ -75,9 +81,23 @@ class FCodeMapper(LokiStringifyMapper):
     def map_literal_list(self, expr, enclosing_prec, *args, **kwargs):
         values = ', '.join(self.rec(c, PREC_NONE, *args, **kwargs) for c in expr.elements)
         if expr.dtype is not None:
-            return f'(/ {fgen(expr.dtype)} :: {values} /)'
+            return f'(/ {self._fgen_type(expr.dtype)} :: {values} /)'
         return f'(/ {values} /)'
 
+    def _fgen_type(self, dtype):
+        """
+        Generate the type specification of a typed array constructor
+
+        Memoizing mappers are used only for the duration of a single code generation
+        run, so they keep one :any:`FortranCodegen` instance for this instead of
+        creating a new one for every array constructor.
+        """
+        if self._cache is None:
+            return fgen(dtype)
+        if self._type_codegen is None:
+            self._type_codegen = FortranCodegen(linewidth=132, conservative=False)
+        return self._type_codegen.visit(dtype) or ''
+
     def map_foreign(self, expr, *args, **kwargs):
         try:
             return super().map_foreign(expr, *args, **kwargs)
@@ -108,9 +128,28 @@ class FortranCodegen(Stringifier):
     """
     # pylint: disable=unused-argument
 
+    _declaration_attributes = (
+        ('external', 'EXTERNAL'), ('save', 'SAVE'), ('allocatable', 'ALLOCATABLE'),
+        ('pointer', 'POINTER'), ('value', 'VALUE'), ('optional', 'OPTIONAL'),
+        ('parameter', 'PARAMETER'), ('target', 'TARGET'), ('contiguous', 'CONTIGUOUS'),
+    )
+    """
+    Boolean declaration attributes of :any:`SymbolAttributes` in the order they are
+    written by :meth:`visit_SymbolAttributes`, with their Fortran keyword
+    """
+
+    _basic_types = {
+        BasicType.LOGICAL: 'LOGICAL', BasicType.INTEGER: 'INTEGER',
+        BasicType.REAL: 'REAL', BasicType.CHARACTER: 'CHARACTER',
+        BasicType.COMPLEX: 'COMPLEX', BasicType.DEFERRED: ''
+    }
+    """
+    Map of :any:`BasicType` to the Fortran type name used by :meth:`visit_BasicType`
+    """
+
     def __init__(self, depth=0, indent='  ', linewidth=90, conservative=True):
         super().__init__(depth=depth, indent=indent, linewidth=linewidth,
-                         line_cont=' &\n{}& '.format, symgen=FCodeMapper())
+                         line_cont=' &\n{}& '.format, symgen=FCodeMapper(memoize=True))
         self.conservative = conservative
 
     def apply_label(self, line, label):
@@ -134,9 +173,12 @@ class FortranCodegen(Stringifier):
         """
         Overwrite standard visit routine to inject original source in conservative mode.
         """
-        if self.conservative and hasattr(o, 'source') and getattr(o.source, 'string', None) is not None:
+        if not self.conservative:
+            return super().visit(o, *args, **kwargs)
+        source = getattr(o, 'source', None)
+        if source is not None and getattr(source, 'string', None) is not None:
             # Re-use original source associated with node
-            return o.source.string
+            return source.string
         return super().visit(o, *args, **kwargs)
 
     # Handler for outer objects
@@ -244,12 +286,10 @@ class FortranCodegen(Stringifier):
         Recurse for each item in the tuple and return as separate lines.
         Insert labels if existing.
         """
-        lines = []
-        for item in o:
-            line = self.visit(item, **kwargs)
-            line = self.apply_label(line, getattr(item, 'label', None))
-            lines.append(line)
-        return self.join_lines(*lines)
+        if not o:
+            return None
+        lines = (self.apply_label(self.visit(item, **kwargs), getattr(item, 'label', None)) for item in o)
+        return '\n'.join(line for line in lines if line is not None)
 
     visit_list = visit_tuple
 
@@ -262,7 +302,7 @@ class FortranCodegen(Stringifier):
         """
         Format intrinsic nodes.
         """
-        return self.format_line(str(o.text).lstrip())
+        return self.format_line(o.text.lstrip())
 
     def visit_RawSource(self, o, **kwargs):
         """
@@ -276,7 +316,8 @@ class FortranCodegen(Stringifier):
         """
         text = o.text
         if not text:
-            text = o.source.string if o.source else ''
+            source = o.source
+            text = source.string if source else ''
         return self.format_line(str(text).lstrip(), no_wrap=True)
 
     def visit_Pragma(self, o, **kwargs):
@@ -525,15 +566,15 @@ class FortranCodegen(Stringifier):
           END INTERFACE
         """
         if o.abstract:
-            header = self.format_line('ABSTRACT INTERFACE')
-            footer = self.format_line('END INTERFACE')
+            header = self.format_token_line('ABSTRACT INTERFACE')
+            footer = self.format_token_line('END INTERFACE')
         elif o.spec:
             generic_spec = self.visit(o.spec, **kwargs)
             header = self.format_line('INTERFACE ', generic_spec)
             footer = self.format_line('END INTERFACE ', generic_spec)
         else:
-            header = self.format_line('INTERFACE')
-            footer = self.format_line('END INTERFACE')
+            header = self.format_token_line('INTERFACE')
+            footer = self.format_token_line('END INTERFACE')
         self.depth += 1
         body = self.visit(o.body, **kwargs)
         self.depth -= 1
@@ -554,7 +595,7 @@ class FortranCodegen(Stringifier):
         header = self.format_line(header_name, 'DO ', label, control)
         if o.has_end_do:
             footer_name = f' {o.name}' if o.name else ''
-            footer = self.format_line('END DO', footer_name)
+            footer = self.format_token_line(f'END DO{footer_name}')
             footer = self.apply_label(footer, o.loop_label)
         else:
             footer = None
@@ -580,7 +621,7 @@ class FortranCodegen(Stringifier):
         header = self.format_line(header_name, 'DO', label, control)
         if o.has_end_do:
             footer_name = f' {o.name}' if o.name else ''
-            footer = self.format_line('END DO', footer_name)
+            footer = self.format_token_line(f'END DO{footer_name}')
             footer = self.apply_label(footer, o.loop_label)
         else:
             footer = None
@@ -610,31 +651,46 @@ class FortranCodegen(Stringifier):
             body = self.visit(o.body, **kwargs)
             self.depth = d
             # Undo the indentation, so that we may re-format and re-indent
-            line = f'IF ({cond}) ' + ''.join(body.lstrip().split('&\n&'))
+            line = f'IF ({cond}) ' + body.lstrip().replace('&\n&', '')
             return self.format_line(line)
 
         name = kwargs.pop('name', f' {o.name}' if o.name else '')
         is_elseif = kwargs.pop('is_elseif', False)
 
-        if is_elseif:
-            header = self.format_line('ELSE IF', ' (', self.visit(o.condition, **kwargs), ') THEN', name)
-        else:
-            header = f'{name[1:]}: IF' if name else 'IF'
-            header = self.format_line(header, ' (', self.visit(o.condition, **kwargs), ') THEN')
+        lines = []
+        # Walk the chain of else-if branches in a single loop
+        while True:
+            if is_elseif:
+                header = self.format_line('ELSE IF', ' (', self.visit(o.condition, **kwargs), ') THEN', name)
+            else:
+                header = f'{name[1:]}: IF' if name else 'IF'
+                header = self.format_line(header, ' (', self.visit(o.condition, **kwargs), ') THEN')
+            lines += [header]
 
-        self.depth += 1
-        body = self.visit(o.body, **kwargs)
-        if o.has_elseif:
+            self.depth += 1
+            lines += [self.visit(o.body, **kwargs)]
             self.depth -= 1
-            else_body = [self.visit(o.else_body, is_elseif=True, name=name, **kwargs)]
-        else:
-            else_body = [self.visit(o.else_body, **kwargs)]
+            if not o.has_elseif:
+                break
+
+            elseif = o.else_body[0]
+            if elseif.inline or elseif.label is not None or (
+                    self.conservative and getattr(elseif.source, 'string', None) is not None
+            ):
+                # Else-if branches that are not formatted as a plain branch of the chain
+                # go through the regular visit routine
+                lines += [self.visit(o.else_body, is_elseif=True, name=name, **kwargs)]
+                return self.join_lines(*lines)
+            o, is_elseif = elseif, True
+
+        if o.else_body:
+            lines += [self.format_token_line(f'ELSE{name}')]
+            self.depth += 1
+            lines += [self.visit(o.else_body, **kwargs)]
             self.depth -= 1
-            if o.else_body:
-                else_body = [self.format_line('ELSE', name)] + else_body
-            else_body += [self.format_line('END IF', name)]
+        lines += [self.format_token_line(f'END IF{name}')]
 
-        return self.join_lines(header, body, *else_body)
+        return self.join_lines(*lines)
 
     def visit_MultiConditional(self, o, **kwargs):
         """
@@ -656,8 +712,8 @@ class FortranCodegen(Stringifier):
             case = self.visit_all(as_tuple(value), **kwargs)
             cases.append(self.format_line('CASE (', self.join_items(case), ')', name))
         if o.else_body:
-            cases.append(self.format_line('CASE DEFAULT', name))
-        footer = self.format_line('END SELECT', name)
+            cases.append(self.format_token_line(f'CASE DEFAULT{name}'))
+        footer = self.format_token_line(f'END SELECT{name}')
         self.depth += 1
         bodies = self.visit_all(*o.bodies, o.else_body, **kwargs)
         self.depth -= 1
@@ -702,8 +758,8 @@ class FortranCodegen(Stringifier):
         for cond in o.conditions[1:]:
             cases += [self.format_line('ELSEWHERE (', self.visit(cond, **kwargs), ')')]
         if o.default:
-            cases += [self.format_line('ELSEWHERE')]
-        footer = self.format_line('END WHERE')
+            cases += [self.format_token_line('ELSEWHERE')]
+        footer = self.format_token_line('END WHERE')
 
         self.depth += 1
         bodies = self.visit_all(*o.bodies, o.default, **kwargs)
@@ -727,7 +783,7 @@ class FortranCodegen(Stringifier):
         """
         assocs = [f'{self.visit(a[1], **kwargs)}=>{self.visit(a[0], **kwargs)}' for a in o.associations]
         header = self.format_line('ASSOCIATE (', self.join_items(assocs), ')')
-        footer = self.format_line('END ASSOCIATE')
+        footer = self.format_token_line('END ASSOCIATE')
         body = self.visit(o.body, **kwargs)
         return self.join_lines(header, body, footer)
 
@@ -738,9 +794,10 @@ class FortranCodegen(Stringifier):
         """
         pragma = self.visit(o.pragma, **kwargs)
         name = self.visit(o.name, **kwargs)
-        args = self.visit_all(o.arguments, **kwargs)
-        if o.kwarguments:
-            args += tuple(f'{self.visit(arg[0], **kwargs)}={self.visit(arg[1], **kwargs)}' for arg in o.kwarguments)
+        args = chain(
+            self.visit_all(o.arguments, **kwargs),
+            (f'{self.visit(kw, **kwargs)}={self.visit(arg, **kwargs)}' for kw, arg in o.kwarguments or ())
+        )
         call = self.format_line('CALL ', name, '(', self.join_items(args), ')')
         return self.join_lines(pragma, call)
 
@@ -779,12 +836,16 @@ class FortranCodegen(Stringifier):
         Format declaration attributes as
           <typename>[(<spec>)] [, <attributes>]
         """
+        # Attributes are stored in the object's dict and undefined attributes default to
+        # `None`. Querying them directly avoids the comparatively slow attribute lookup
+        # fallback of `SymbolAttributes` for the many attributes that are usually not set
+        attrs = vars(o)
         attributes = []
 
         if isinstance(o.dtype, ProcedureType):
             typename = ''
         elif isinstance(o.dtype, DerivedType):
-            if o.polymorphic:
+            if attrs.get('polymorphic'):
                 typename = f'CLASS({o.dtype.name})'
             else:
                 typename = f'TYPE({o.dtype.name})'
@@ -792,9 +853,9 @@ class FortranCodegen(Stringifier):
             typename = self.visit(o.dtype)
 
         selector = []
-        if o.length:
+        if attrs.get('length'):
             selector += [f'LEN={self.visit(o.length, **kwargs)}']
-        if o.kind:
+        if attrs.get('kind'):
             selector += [f'KIND={self.visit(o.kind, **kwargs)}']
         if selector:
             typename += '(' + self.join_items(selector) + ')'
@@ -802,43 +863,27 @@ class FortranCodegen(Stringifier):
         if typename:
             attributes += [typename]
 
-        if o.external:
-            attributes += ['EXTERNAL']
-        if o.save:
-            attributes += ['SAVE']
-        if o.allocatable:
-            attributes += ['ALLOCATABLE']
-        if o.pointer:
-            attributes += ['POINTER']
-        if o.value:
-            attributes += ['VALUE']
-        if o.optional:
-            attributes += ['OPTIONAL']
-        if o.parameter:
-            attributes += ['PARAMETER']
-        if o.target:
-            attributes += ['TARGET']
-        if o.contiguous:
-            attributes += ['CONTIGUOUS']
-        if o.intent:
+        attributes += [keyword for name, keyword in self._declaration_attributes if attrs.get(name)]
+        if attrs.get('intent'):
             attributes += [f'INTENT({o.intent.upper()})']
 
         # Access spec
-        if o.private:
+        if attrs.get('private'):
             attributes += ['PRIVATE']
-        if o.public:
+        if attrs.get('public'):
             attributes += ['PUBLIC']
 
         # Binding attributes
-        if o.pass_attr is True:
+        pass_attr = attrs.get('pass_attr')
+        if pass_attr is True:
             attributes += ['PASS']
-        elif o.pass_attr is False:
+        elif pass_attr is False:
             attributes += ['NOPASS']
-        elif o.pass_attr is not None:
-            attributes += [f'PASS({o.pass_attr!s})']
-        if o.non_overridable:
+        elif pass_attr is not None:
+            attributes += [f'PASS({pass_attr!s})']
+        if attrs.get('non_overridable'):
             attributes += ['NON_OVERRIDABLE']
-        if o.deferred:
+        if attrs.get('deferred'):
             attributes += ['DEFERRED']
 
         return self.join_items(attributes)
@@ -874,10 +919,7 @@ class FortranCodegen(Stringifier):
         return self.join_lines(header, body, footer)
 
     def visit_BasicType(self, o, **kwargs):
-        type_map = {BasicType.LOGICAL: 'LOGICAL', BasicType.INTEGER: 'INTEGER',
-                    BasicType.REAL: 'REAL', BasicType.CHARACTER: 'CHARACTER',
-                    BasicType.COMPLEX: 'COMPLEX', BasicType.DEFERRED: ''}
-        return type_map[o]
+        return self._basic_types[o]
 
     def visit_DerivedType(self, o, **kwargs):
         return o.name
@@ -893,8 +935,8 @@ class FortranCodegen(Stringifier):
             ...
           END ENUM
         """
-        header = self.format_line('ENUM, BIND(C)')
-        footer = self.format_line('END ENUM')
+        header = self.format_token_line('ENUM, BIND(C)')
+        footer = self.format_token_line('END ENUM')
         self.depth += 1
         body = []
         for var in o.symbols:
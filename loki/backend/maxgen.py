@@ -7,38 +7,46 @@
 
 from pymbolic.mapper.stringifier import PREC_NONE, PREC_CALL, PREC_COMPARISON
 
+from loki.backend.util import lookup_backend_type
 from loki.expression.mappers import LokiStringifyMapper
 from loki.ir import Import
 from loki.types import BasicType, DerivedType
-from loki.visitors import Stringifier, FindNodes
+from loki.visitors import Stringifier
 
 __all__ = ['maxjgen', 'MaxjCodegen', 'MaxjCodeMapper']
 
 
+_MAXJ_LOCAL_TYPES = {
+    (BasicType.LOGICAL, None): 'boolean',
+    (BasicType.INTEGER, None): 'int',
+    (BasicType.REAL, 'real32'): 'float',
+    (BasicType.REAL, None): 'double',
+}
+"""
+Map of ``(dtype, kind)`` to the corresponding local Java type in maxj,
+with ``kind=None`` as the fallback for each :any:`BasicType`
+"""
+
+_MAXJ_DFEVAR_TYPES = {
+    (BasicType.LOGICAL, None): 'dfeBool()',
+    (BasicType.INTEGER, None): 'dfeUInt(32)',  # TODO: Distinguish between signed and unsigned
+    (BasicType.REAL, 'real32'): 'dfeFloat(8, 24)',
+    (BasicType.REAL, None): 'dfeFloat(11, 53)',
+}
+"""
+Map of ``(dtype, kind)`` to the corresponding DFEVar type in maxj,
+with ``kind=None`` as the fallback for each :any:`BasicType`
+"""
+
+
 def maxj_local_type(_type):
     if _type.dtype == BasicType.DEFERRED:
         return _type.name
-    if _type.dtype == BasicType.LOGICAL:
-        return 'boolean'
-    if _type.dtype == BasicType.INTEGER:
-        return 'int'
-    if _type.dtype == BasicType.REAL:
-        if str(_type.kind) in ['real32']:
-            return 'float'
-        return 'double'
-    raise ValueError(str(_type))
+    return lookup_backend_type(_MAXJ_LOCAL_TYPES, _type)
 
 
 def maxj_dfevar_type(_type):
-    if _type.dtype == BasicType.LOGICAL:
-        return 'dfeBool()'
-    if _type.dtype == BasicType.INTEGER:
-        return 'dfeUInt(32)'  # TODO: Distinguish between signed and unsigned
-    if _type.dtype == BasicType.REAL:
-        if str(_type.kind) in ['real32']:
-            return 'dfeFloat(8, 24)'
-        return 'dfeFloat(11, 53)'
-    raise ValueError(str(_type))
+    return lookup_backend_type(_MAXJ_DFEVAR_TYPES, _type)
 
 
 class MaxjCodeMapper(LokiStringifyMapper):
@@ -55,8 +63,8 @@ class MaxjCodeMapper(LokiStringifyMapper):
         ptr = '*' if expr.type and expr.type.pointer else ''
         if expr.parent is not None:
             parent = self.parenthesize(self.rec(expr.parent, enclosing_prec, *args, **kwargs))
-            return self.format('%s%s.%s', ptr, parent, expr.basename)
-        return self.format('%s%s', ptr, expr.name)
+            return f'{ptr}{parent}.{expr.basename}'
+        return f'{ptr}{expr.name}'
 
     def map_meta_symbol(self, expr, enclosing_prec, *args, **kwargs):
         return self.rec(expr._symbol, enclosing_prec, *args, **kwargs)
@@ -66,12 +74,9 @@ class MaxjCodeMapper(LokiStringifyMapper):
 
     def map_array_subscript(self, expr, enclosing_prec, *args, **kwargs):
         name_str = self.rec(expr.aggregate, PREC_NONE, *args, **kwargs)
-        index_str = ''
-        for index in expr.index_tuple:
-            d = self.format(self.rec(index, PREC_NONE, *args, **kwargs))
-            if d:
-                index_str += self.format('[%s]', d)
-        return self.format('%s%s', name_str, index_str)
+        dims = (self.rec(index, PREC_NONE, *args, **kwargs) for index in expr.index_tuple)
+        index_str = ''.join(f'[{d}]' for d in dims if d)
+        return f'{name_str}{index_str}'
 
     map_string_subscript = map_array_subscript
 
@@ -82,15 +87,15 @@ class MaxjCodeMapper(LokiStringifyMapper):
         name = self.rec(expr.function, PREC_CALL, *args, **kwargs)
         expression = self.rec(expr.parameters[0], PREC_NONE, *args, **kwargs)
         kind = f'{maxj_dfevar_type(expr.kind)}, ' if expr.kind else ''
-        return self.format('%s(%s%s)', name, kind, expression)
+        return f'{name}({kind}{expression})'
 
     def map_comparison(self, expr, enclosing_prec, *args, **kwargs):
         if expr.operator in ('==', '!='):
+            left = self.rec(expr.left, PREC_CALL, *args, **kwargs)
+            operator = {'==': 'eq', '!=': 'neq'}[expr.operator]
+            right = self.rec(expr.right, PREC_NONE, *args, **kwargs)
             return self.parenthesize_if_needed(
-                self.format("%s.%s(%s)", self.rec(expr.left, PREC_CALL, *args, **kwargs),
-                            {'==': 'eq', '!=': 'neq'}[expr.operator],
-                            self.rec(expr.right, PREC_NONE, *args, **kwargs)),
-                enclosing_prec, PREC_COMPARISON)
+                f'{left}.{operator}({right})', enclosing_prec, PREC_COMPARISON)
         return super().map_comparison(expr, enclosing_prec, *args, **kwargs)
 
 
@@ -99,9 +104,19 @@ class MaxjCodegen(Stringifier):
     Tree visitor to generate Maxeler maxj kernel code from IR.
     """
 
+    _module_kinds = (
+        ('ManagerMAX5C', True, False),
+        ('Manager', True, True),
+        ('Kernel', False, False),
+    )
+    """
+    Module name suffixes in the order they are matched, with flags for
+    ``(is_manager, is_interface)`` of the corresponding module kind
+    """
+
     def __init__(self, depth=0, indent='  ', linewidth=90):
         super().__init__(depth=depth, indent=indent, linewidth=linewidth,
-                         line_cont='\n{}  '.format, symgen=MaxjCodeMapper())
+                         line_cont='\n{}  '.format, symgen=MaxjCodeMapper(memoize=True))
 
     # Handler for outer objects
 
@@ -152,27 +167,27 @@ class MaxjCodegen(Stringifier):
             }
         """
         # Figure out what kind of module we have here
-        if o.name.endswith('ManagerMAX5C'):
-            is_manager = True
-            is_interface = False
-            package_name = o.name[:-len('ManagerMAX5C')]
-        elif o.name.endswith('Manager'):
-            is_manager = True
-            is_interface = True
-            package_name = o.name[:-len('Manager')]
-        elif o.name.endswith('Kernel'):
-            is_manager = False
-            package_name = o.name[:-len('Kernel')]
+        for suffix, is_manager, is_interface in self._module_kinds:
+            if o.name.endswith(suffix):
+                package_name = o.name[:-len(suffix)]
+                break
         else:
             raise ValueError('Module is neither Manager nor Kernel')
 
+        # Rest of the spec and subroutines, which are generated first to collect
+        # the imports on the way instead of traversing the spec separately for them
+        imports = []
+        self.depth += 1
+        body = [self.visit(o.spec, skip_imports=True, imports=imports, **kwargs)]
+        body.extend(self.visit(routine, **kwargs) for routine in o.subroutines)
+        self.depth -= 1
+
         # Declare package
         header = [self.format_line('package ', package_name, ';')]
 
         # Some imports
         # TODO: include here imports defined by routines
-        imports = FindNodes(Import).visit(o.spec)
-        header += self.visit_all(imports, **kwargs)
+        header.extend(self.visit(imprt, **kwargs) for imprt in imports)
 
         # Class signature
         if is_manager:
@@ -184,17 +199,9 @@ class MaxjCodegen(Stringifier):
                     'public class ', o.name, ' extends MAX5CManager implements ', o.name[:-5], ' {')]
         else:
             header += [self.format_line('class ', o.name, ' extends Kernel {')]
-        self.depth += 1
-
-        # Rest of the spec
-        body = [self.visit(o.spec, skip_imports=True, **kwargs)]
-
-        # Create subroutines
-        body += self.visit_all(o.subroutines, **kwargs)
 
         # Footer
-        self.depth -= 1
-        footer = [self.format_line('}')]
+        footer = [self.format_token_line('}')]
 
         return self.join_lines(*header, *body, *footer)
 
@@ -210,8 +217,8 @@ class MaxjCodegen(Stringifier):
             }
         """
         # Constructor signature
-        args = [f'{self.visit(arg.type, **kwargs)} {self.visit(arg, **kwargs)}'
-                for arg in o.arguments]
+        args = (f'{self.visit(arg.type, **kwargs)} {self.visit(arg, **kwargs)}'
+                for arg in o.arguments)
         header = [self.format_line(o.name, '(', self.join_items(args), ') {')]
         self.depth += 1
 
@@ -221,7 +228,7 @@ class MaxjCodegen(Stringifier):
 
         # Closing brackets
         self.depth -= 1
-        footer = [self.format_line('}')]
+        footer = [self.format_token_line('}')]
 
         return self.join_lines(*header, *body, *footer)
 
@@ -249,16 +256,21 @@ class MaxjCodegen(Stringifier):
         """
         Format comments.
         """
-        text = o.text or o.source.string
-        text = str(text).lstrip().replace('!', '//', 1)
+        text = str(o.text or o.source.string).lstrip()
+        if text[:1] == '!':
+            # Fast path for the usual case of a leading comment marker
+            text = '//' + text[1:]
+        else:
+            text = text.replace('!', '//', 1)
         return self.format_line(text, no_wrap=True)
 
     def visit_CommentBlock(self, o, **kwargs):
         """
         Format comment blocks.
         """
-        comments = self.visit_all(o.comments, **kwargs)
-        return self.join_lines(*comments)
+        if not o.comments:
+            return None
+        return '\n'.join(self.visit(comment, **kwargs) for comment in o.comments)
 
     def visit_VariableDeclaration(self, o, **kwargs):
         """
@@ -274,7 +286,11 @@ class MaxjCodegen(Stringifier):
 
         def format_declaration(var):
             var_type = self.visit(var.type, **kwargs)
-            var_name = self.visit(var.clone(dimensions=None), **kwargs)
+            # Only create a copy without dimensions if there are any to strip
+            if getattr(var, 'dimensions', None):
+                var_name = self.visit(var.clone(dimensions=None), **kwargs)
+            else:
+                var_name = self.visit(var, **kwargs)
             if var.initial:
                 initial = self.visit(var.initial, **kwargs)
                 return self.format_line(var_type, ' ', var_name, ' = ', initial, ';')
@@ -299,7 +315,7 @@ class MaxjCodegen(Stringifier):
             end=self.visit(o.bounds.stop, **kwargs),
             incr=self.visit(o.bounds.step, **kwargs) if o.bounds.step else 1)
         header = self.format_line(control, ' {')
-        footer = self.format_line('}')
+        footer = self.format_token_line('}')
         self.depth += 1
         body = self.visit(o.body, **kwargs)
         self.depth -= 1
@@ -346,6 +362,18 @@ class MaxjCodegen(Stringifier):
         """
         Format the section's body.
         """
+        if kwargs.get('skip_imports') is True:
+            # Filter imports here instead of dispatching them to visit_Import
+            imports = kwargs.get('imports')
+            lines = []
+            for node in o.body:
+                if isinstance(node, Import):
+                    if imports is not None:
+                        imports.append(node)
+                    lines.append(None)
+                else:
+                    lines.append(self.visit(node, **kwargs))
+            return self.join_lines(*lines)
         return self.visit(o.body, **kwargs)
 
     def visit_CallStatement(self, o, **kwargs):
@@ -357,7 +385,7 @@ class MaxjCodegen(Stringifier):
             <name>(<args>)
         """
         name = self.visit(o.name, **kwargs)
-        args = self.visit_all(o.arguments, **kwargs)
+        args = (self.visit(arg, **kwargs) for arg in o.arguments)
         assert not o.kwarguments
         return self.format_line(name, '(', self.join_items(args), ');')
 
@@ -370,6 +398,10 @@ class MaxjCodegen(Stringifier):
             import <name>;
         """
         if kwargs.get('skip_imports') is True:
+            # Hand the import to the caller if it collects them
+            imports = kwargs.get('imports')
+            if imports is not None:
+                imports.append(o)
             return None
         assert not o.symbols
         return self.format_line('import ', o.module, ';')
@@ -5,8 +5,10 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from itertools import chain
 from pymbolic.mapper.stringifier import PREC_NONE, PREC_CALL
 
+from loki.backend.util import lookup_backend_type
 from loki.expression import symbols as sym, LokiStringifyMapper
 from loki.visitors import Stringifier
 from loki.types import BasicType, DerivedType, SymbolAttributes
@@ -15,20 +17,24 @@ from loki.types import BasicType, DerivedType, SymbolAttributes
 __all__ = ['pygen', 'PyCodegen', 'PyCodeMapper']
 
 
+_NUMPY_TYPES = {
+    (BasicType.LOGICAL, None): 'bool',
+    (BasicType.INTEGER, None): 'np.int32',
+    (BasicType.REAL, 'real32'): 'np.float32',
+    (BasicType.REAL, None): 'np.float64',
+}
+"""
+Map of ``(dtype, kind)`` to the corresponding numpy type,
+with ``kind=None`` as the fallback for each :any:`BasicType`
+"""
+
+
 def numpy_type(_type):
     if _type.shape is not None:
         return 'np.ndarray'
-    if _type.dtype == BasicType.LOGICAL:
-        return 'bool'
-    if _type.dtype == BasicType.INTEGER:
-        return 'np.int32'
-    if _type.dtype == BasicType.REAL:
-        if str(_type.kind) in ('real32',):
-            return 'np.float32'
-        return 'np.float64'
     if isinstance(_type.dtype, DerivedType):
         return _type.dtype.name
-    raise ValueError(str(_type))
+    return lookup_backend_type(_NUMPY_TYPES, _type)
 
 
 class PyCodeMapper(LokiStringifyMapper):
@@ -51,7 +57,7 @@ class PyCodeMapper(LokiStringifyMapper):
             self.join_rec('', expr.parameters, PREC_NONE, *args, **kwargs),
             PREC_CALL, PREC_NONE)
         return self.parenthesize_if_needed(
-            self.format('%s(%s)', numpy_type(_type), expression), enclosing_prec, PREC_CALL)
+            f'{numpy_type(_type)}({expression})', enclosing_prec, PREC_CALL)
 
     def map_variable_symbol(self, expr, enclosing_prec, *args, **kwargs):
         return expr.name.replace('%', '.')
@@ -64,13 +70,13 @@ class PyCodeMapper(LokiStringifyMapper):
 
     def map_array_subscript(self, expr, enclosing_prec, *args, **kwargs):
         name_str = self.rec(expr.aggregate, PREC_NONE, *args, **kwargs)
-        dims = [self.format(self.rec(d, PREC_NONE, *args, **kwargs)) for d in expr.index_tuple]
+        dims = [self.rec(d, PREC_NONE, *args, **kwargs) for d in expr.index_tuple]
         dims = [d for d in dims if d]
         if not dims:
             index_str = ''
         else:
             index_str = f'[{", ".join(dims)}]'
-        return self.format('%s%s', name_str, index_str)
+        return f'{name_str}{index_str}'
 
     map_string_subscript = map_array_subscript
 
@@ -87,7 +93,7 @@ class PyCodeMapper(LokiStringifyMapper):
             )
 
         f = self.rec(expr.function, PREC_NONE, *args, **kwargs)
-        return self.format(f'{str(f)}({arguments})')
+        return f'{f}({arguments})'
 
     def map_deferred_type_symbol(self, expr, *args, **kwargs):
         return str(expr.name).replace('%', '.')
@@ -100,7 +106,7 @@ class PyCodegen(Stringifier):
 
     def __init__(self, depth=0, indent='  ', linewidth=100):
         super().__init__(depth=depth, indent=indent, linewidth=linewidth,
-                         line_cont='\n{}  '.format, symgen=PyCodeMapper())
+                         line_cont='\n{}  '.format, symgen=PyCodeMapper(memoize=True))
 
     # Handler for outer objects
 
@@ -172,16 +178,21 @@ class PyCodegen(Stringifier):
         """
         Format comments.
         """
-        text = o.text or o.source.string
-        text = str(text).lstrip().replace('!', '#', 1)
+        text = str(o.text or o.source.string).lstrip()
+        if text[:1] == '!':
+            # Fast path for the usual case of a leading comment marker
+            text = '#' + text[1:]
+        else:
+            text = text.replace('!', '#', 1)
         return self.format_line(text, no_wrap=True)
 
     def visit_CommentBlock(self, o, **kwargs):
         """
         Format comment blocks.
         """
-        comments = self.visit_all(o.comments, **kwargs)
-        return self.join_lines(*comments)
+        if not o.comments:
+            return None
+        return '\n'.join(self.visit(comment, **kwargs) for comment in o.comments)
 
     def visit_VariableDeclaration(self, o, **kwargs):
         """
@@ -266,18 +277,23 @@ class PyCodegen(Stringifier):
         """
         is_elseif = kwargs.pop('is_elseif', False)
         keyword = 'elif' if is_elseif else 'if'
-        header = self.format_line(keyword, ' ', self.visit(o.condition, **kwargs), ':')
-        self.depth += 1
-        body = self.visit(o.body, **kwargs)
-        if o.has_elseif:
+        lines = []
+        # Walk the chain of else-if branches in a single loop
+        while True:
+            lines.append(self.format_line(keyword, ' ', self.visit(o.condition, **kwargs), ':'))
+            self.depth += 1
+            lines.append(self.visit(o.body, **kwargs))
             self.depth -= 1
-            else_body = [self.visit(o.else_body, is_elseif=True, **kwargs)]
-        else:
-            else_body = [self.visit(o.else_body, **kwargs)]
+            if not o.has_elseif:
+                break
+            o = o.else_body[0]
+            keyword = 'elif'
+        if o.else_body:
+            lines.append(self.format_token_line('else:'))
+            self.depth += 1
+            lines.append(self.visit(o.else_body, **kwargs))
             self.depth -= 1
-            if o.else_body:
-                else_body = [self.format_line('else:')] + else_body
-        return self.join_lines(header, body, *else_body)
+        return self.join_lines(*lines)
 
     def visit_Assignment(self, o, **kwargs):
         """
@@ -302,9 +318,11 @@ class PyCodegen(Stringifier):
         Format call statement as
           <name>(<args>)
         """
-        args = self.visit_all(o.arguments, **kwargs)
-        kw_args = tuple(f'{kw}={self.visit(arg, **kwargs)}' for kw, arg in o.kwarguments)
-        return self.format_line(o.name, '(', self.join_items(args + kw_args), ')')
+        args = chain(
+            (self.visit(arg, **kwargs) for arg in o.arguments),
+            (f'{kw}={self.visit(arg, **kwargs)}' for kw, arg in o.kwarguments or ())
+        )
+        return self.format_line(o.name, '(', self.join_items(args), ')')
 
     def visit_SymbolAttributes(self, o, **kwargs):  # pylint: disable=unused-argument
         return numpy_type(o)
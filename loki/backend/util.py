@@ -0,0 +1,41 @@
+# (C) Copyright 2018- ECMWF.
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+__all__ = ['lookup_backend_type']
+
+
+def lookup_backend_type(type_map, _type):
+    """
+    Look up the target language type for a Loki type in a backend's type map
+
+    Parameters
+    ----------
+    type_map : dict
+        Map of ``(dtype, kind)`` to the type in the target language, with
+        ``kind=None`` as the fallback for each :any:`BasicType`
+    _type : :any:`SymbolAttributes`
+        The type to look up
+
+    Returns
+    -------
+    str
+        The type in the target language
+
+    Raises
+    ------
+    ValueError
+        If there is no entry for the type's dtype in :data:`type_map`
+    """
+    dtype = _type.dtype
+    if _type.kind:
+        result = type_map.get((dtype, str(_type.kind)))
+        if result is not None:
+            return result
+    result = type_map.get((dtype, None))
+    if result is None:
+        raise ValueError(str(_type))
+    return result
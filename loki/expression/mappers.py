@@ -19,9 +19,9 @@ from pymbolic.mapper.stringifier import (
 )
 try:
     from fparser.two.Fortran2003 import Intrinsic_Name
-    _intrinsic_fortran_names = Intrinsic_Name.function_names
+    _intrinsic_fortran_names = frozenset(name.lower() for name in Intrinsic_Name.function_names)
 except ImportError:
-    _intrinsic_fortran_names = ()
+    _intrinsic_fortran_names = frozenset()
 
 from loki.logging import debug
 from loki.tools import as_tuple, flatten
@@ -34,20 +34,73 @@ __all__ = ['LokiStringifyMapper', 'ExpressionRetriever', 'ExpressionDimensionsMa
 
 
 
-class LokiStringifyMapper(StringifyMapper):
+_mapper_methods = {}
+"""
+Mapper methods resolved per pair of mapper class and expression class
+by :meth:`MapperMethodCacheMixin.rec`
+"""
+
+
+class MapperMethodCacheMixin:
+    """
+    Mixin for Pymbolic mappers that resolves the mapper method for each
+    combination of mapper class and expression class only once.
+
+    The resolved methods are kept in a module-level table, so that they are
+    reused across all instances of a mapper class. Note that mapper methods
+    are looked up on the class and that instance attributes are not considered.
+    """
+
+    def rec(self, expr, *args, **kwargs):
+        """
+        Dispatch :data:`expr` to its mapper method.
+
+        Objects without a matching mapper method are handled by Pymbolic's
+        generic dispatch mechanism.
+        """
+        key = (self.__class__, expr.__class__)
+        method = _mapper_methods.get(key)
+        if method is None:
+            method_name = getattr(expr, 'mapper_method', None)
+            method = getattr(self.__class__, method_name, None) if method_name else None
+            if method is None:
+                return super().rec(expr, *args, **kwargs)
+            _mapper_methods[key] = method
+        return method(self, expr, *args, **kwargs)
+
+
+class LokiStringifyMapper(MapperMethodCacheMixin, StringifyMapper):
     """
     A class derived from the default :class:`StringifyMapper` that adds mappings for nodes of the
     expression tree that we added ourselves.
 
     This is the default pretty printer for nodes in the expression tree.
+
+    Parameters
+    ----------
+    memoize : bool, optional
+        Reuse the string representation of subexpressions that are
+        encountered repeatedly during the lifetime of the mapper.
     """
     # pylint: disable=unused-argument,abstract-method
 
     _regex_string_literal = re.compile(r"((?<!')'(?:'')*(?!'))")
 
-    def __init__(self, *args, **kwargs):
+    memoize_min_length = 8
+    """
+    Minimum length of an expression's string representation for it to be
+    stored in the memoization cache of :meth:`_rec_memoized`
+    """
+
+    def __init__(self, *args, memoize=False, **kwargs):
         from loki.expression import operations as op  # pylint: disable=import-outside-toplevel,cyclic-import
         super().__init__(*args, **kwargs)
+        self._cache = None
+        if memoize:
+            # Route the recursion through the memoizing dispatch only if requested,
+            # to keep the default dispatch free of any overhead
+            self._cache = {}
+            self.rec = self._rec_memoized
 
         # This should really be a class property but due to the circular dependency
         # (Pymbolic expression nodes requiring `LokiStringifyMapper` for `make_stringifier`)
@@ -56,6 +109,29 @@ class LokiStringifyMapper(StringifyMapper):
             op.ParenthesisedAdd, op.ParenthesisedMul,
             op.ParenthesisedDiv, op.ParenthesisedPow
         )
+        self._parenthesised_mul = op.ParenthesisedMul
+
+    def _rec_memoized(self, expr, *args, **kwargs):
+        """
+        Dispatch :data:`expr` to its mapper method, reusing the result of a
+        previous invocation for the same expression object and precedence.
+
+        This replaces :meth:`rec` for mappers created with ``memoize=True``.
+        It is only safe as long as the expression trees are not modified
+        during the lifetime of the mapper.
+        """
+        if kwargs or len(args) != 1:
+            return self.__class__.rec(self, expr, *args, **kwargs)
+        cache = self._cache
+        key = (id(expr), args[0])
+        cached = cache.get(key)
+        if cached is not None:
+            return cached[1]
+        result = self.__class__.rec(self, expr, *args)
+        if len(result) >= self.memoize_min_length:
+            # Keep a reference to expr to guarantee its id remains unique
+            cache[key] = (expr, result)
+        return result
 
     def rec_with_force_parens_around(self, expr, *args, **kwargs):
         # Re-implement here to add no_force_parens_around
@@ -129,19 +205,9 @@ class LokiStringifyMapper(StringifyMapper):
         Since substraction and unary minus are mapped to multiplication with (-1), we are here
         looking for such cases and determine the matching operator for the output.
         """
-        from loki.expression.operations import ParenthesisedMul  # pylint: disable=import-outside-toplevel,cyclic-import
-        def get_op_prec_expr(expr):
-            if isinstance(expr, pmbl.Product) and not isinstance(expr, ParenthesisedMul):
-                if pmbl.is_zero(expr.children[0]+1):
-                    if len(expr.children) == 2:
-                        # only the minus sign and the other child
-                        return '-', PREC_PRODUCT, expr.children[1]
-                    return '-', PREC_PRODUCT, expr.__class__(expr.children[1:])
-            return '+', PREC_SUM, expr
-
         terms = []
         for ch in expr.children:
-            op, prec, expr = get_op_prec_expr(ch)
+            op, prec, expr = self._get_sum_term_op_prec_expr(ch)
             terms += [op, self.rec(expr, prec, *args, **kwargs)]
 
         # Remove leading '+'
@@ -151,6 +217,19 @@ class LokiStringifyMapper(StringifyMapper):
 
         return self.parenthesize_if_needed(self.join(' ', terms), enclosing_prec, PREC_SUM)
 
+    def _get_sum_term_op_prec_expr(self, expr):
+        """
+        Determine operator, precedence and expression for a term in :meth:`map_sum`,
+        detecting negative terms that are encoded as multiplication with (-1)
+        """
+        if isinstance(expr, pmbl.Product) and not isinstance(expr, self._parenthesised_mul):
+            if pmbl.is_zero(expr.children[0]+1):
+                if len(expr.children) == 2:
+                    # only the minus sign and the other child
+                    return '-', PREC_PRODUCT, expr.children[1]
+                return '-', PREC_PRODUCT, expr.__class__(expr.children[1:])
+        return '+', PREC_SUM, expr
+
     def map_product(self, expr, enclosing_prec, *args, **kwargs):
         if len(expr.children) == 2 and expr.children[0] == -1:
             # Negative values are encoded as multiplication by (-1) (constant, not IntLiteral).
@@ -218,7 +297,7 @@ class LokiStringifyMapper(StringifyMapper):
         return self.format('%s', self.rec(expr.expression, PREC_NONE, *args, **kwargs))
 
 
-class LokiWalkMapper(WalkMapper):
+class LokiWalkMapper(MapperMethodCacheMixin, WalkMapper):
     """
     A mapper that traverses the expression tree and calls :meth:`visit`
     for each visited node.
@@ -248,7 +327,11 @@ class LokiWalkMapper(WalkMapper):
         if not self.visit(expr):
             return
         self.rec(expr.aggregate, *args, **kwargs)
-        self.rec(expr.index, *args, **kwargs)
+        if isinstance(expr.index, tuple):
+            # Skip the foreign-object dispatch in ``rec`` for the index tuple
+            self.map_tuple(expr.index, *args, **kwargs)
+        else:
+            self.rec(expr.index, *args, **kwargs)
         self.post_visit(expr, *args, **kwargs)
 
     map_string_subscript = map_array_subscript
@@ -805,8 +888,8 @@ class AttachScopesMapper(LokiIdentityMapper):
                 expr = expr.rescope(symbol_scope)
         elif self.fail:
             raise RuntimeError(f'AttachScopesMapper: {expr!s} was not found in any scope')
-        elif expr not in _intrinsic_fortran_names:
-            debug('AttachScopesMapper: %s was not found in any scopes', str(expr))
+        elif expr.name.lower() not in _intrinsic_fortran_names:
+            debug('AttachScopesMapper: %s was not found in any scopes', expr)
         return expr
 
     def map_variable_symbol(self, expr, *args, **kwargs):
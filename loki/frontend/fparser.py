@@ -6,6 +6,8 @@
 # nor does it submit to any jurisdiction.
 
 # pylint: disable=too-many-lines
+from functools import lru_cache
+from itertools import accumulate
 import re
 
 from codetiming import Timer
@@ -47,6 +49,30 @@ __all__ = ['HAVE_FP', 'FParser2IR', 'parse_fparser_file', 'parse_fparser_source'
            'parse_fparser_ast', 'parse_fparser_expression', 'get_fparser_node']
 
 
+_F2008_PARSER = None
+"""The top-level fparser class for Fortran 2008, once the class hierarchy has been set up"""
+
+_F2008_SUBCLASSES = None
+"""The fparser subclass map created when setting up :data:`_F2008_PARSER`"""
+
+
+def _get_f2008_parser():
+    """
+    Return the fparser parser class for Fortran 2008
+
+    Setting up fparser's class hierarchy is expensive and is therefore done only
+    on the first call. It is repeated only if the hierarchy has since been
+    replaced, e.g., by creating a parser for another standard elsewhere.
+    Parse trees cached by :any:`_parse_fparser_primary` are discarded in that case.
+    """
+    global _F2008_PARSER, _F2008_SUBCLASSES  # pylint: disable=global-statement
+    if _F2008_PARSER is None or Fortran2003.Base.subclasses is not _F2008_SUBCLASSES:
+        _F2008_PARSER = ParserFactory().create(std='f2008')
+        _F2008_SUBCLASSES = Fortran2003.Base.subclasses
+        _parse_fparser_primary.cache_clear()
+    return _F2008_PARSER
+
+
 @Timer(logger=debug, text=lambda s: f'[Loki::FP] Executed parse_fparser_file in {s:.2f}s')
 def parse_fparser_file(filename):
     """
@@ -74,7 +100,7 @@ def parse_fparser_source(source):
         pass
 
     reader = FortranStringReader(source, ignore_comments=False)
-    f2008_parser = ParserFactory().create(std='f2008')
+    f2008_parser = _get_f2008_parser()
 
     return f2008_parser(reader)
 
@@ -109,6 +135,23 @@ def parse_fparser_ast(ast, raw_source, pp_info=None, definitions=None, scope=Non
     return _ir
 
 
+@lru_cache(maxsize=1024)
+def _parse_fparser_primary(source):
+    """
+    Generate the fparser parse tree for an expression string
+
+    The parse tree depends only on the expression string and the fparser
+    class hierarchy, which allows to cache it across calls to
+    :any:`parse_fparser_expression`. This relies on :any:`FParser2IR` only
+    reading the parse tree, and callers have to make sure the hierarchy is
+    set up via :any:`_get_f2008_parser`, which also invalidates the cache when
+    the hierarchy is rebuilt. Scope information is attached only when creating the IR.
+    """
+    # Wrap source in brackets to make sure it appears like a valid expression
+    # for fparser, and strip that Parenthesis node from the ast immediately after
+    return Fortran2003.Primary('(' + source + ')').children[1]
+
+
 def parse_fparser_expression(source, scope):
     """
     Parse an expression string into an expression tree.
@@ -135,10 +178,8 @@ def parse_fparser_expression(source, scope):
         error('Fparser is not installed')
         raise RuntimeError
 
-    _ = ParserFactory().create(std='f2008')
-    # Wrap source in brackets to make sure it appears like a valid expression
-    # for fparser, and strip that Parenthesis node from the ast immediately after
-    ast = Fortran2003.Primary('(' + source + ')').children[1]
+    _ = _get_f2008_parser()
+    ast = _parse_fparser_primary(source)
 
     # We parse the standalone expression with a dummy scope, to avoid
     # overriding existing type info from the given scope, before
@@ -224,6 +265,50 @@ def rget_child(node, node_type):
     return None
 
 
+def get_child_and_index(node, node_type):
+    """
+    Searches for the first, immediate child of the supplied node that is of
+    the specified type and returns it together with its position.
+
+    Unlike ``node.children.index(child)``, which compares nodes by value,
+    this finds the position in the same pass that matches the child's type.
+
+    :param node: the node whose children will be searched.
+    :type node: :py:class:`fparser.two.utils.Base`
+    :param node_type: the class(es) of child node to search for.
+    :type node_type: type or tuple of type
+
+    :returns: the first child node of type node_type and its index in the children.
+    :rtype: (py:class:`fparser.two.utils.Base`, int)
+
+    :raises ValueError: if no child node of type node_type exists.
+    """
+    for index, child in enumerate(node.children):
+        if isinstance(child, node_type):
+            return child, index
+    raise ValueError(f'No child of type {node_type} in {type(node).__name__}')
+
+
+def split_arguments(arguments):
+    """
+    Separates the keyword arguments, given as ``(name, value)`` tuples,
+    from the positional arguments in a single pass over the argument list.
+
+    :param arguments: the visited entries of an argument list.
+    :type arguments: tuple
+
+    :returns: the positional arguments and the keyword arguments.
+    :rtype: (tuple, tuple)
+    """
+    args, kwargs = [], []
+    for arg in arguments:
+        if isinstance(arg, tuple):
+            kwargs += [arg]
+        else:
+            args += [arg]
+    return tuple(args), tuple(kwargs)
+
+
 def extract_fparser_source(node, raw_source):
     """
     Extract the :any:`Source` object for any py:class:`fparser.two.utils.BlockBase`
@@ -254,10 +339,16 @@ class FParser2IR(GenericVisitor):
 
     def __init__(self, raw_source, definitions=None, pp_info=None, scope=None):
         super().__init__()
-        self.raw_source = raw_source.splitlines(keepends=True)
+        self.raw_source = raw_source
+        # Character offsets of the start of each line in the raw source,
+        # with the length of the source as a sentinel
+        self._line_offsets = [0, *accumulate(len(line) for line in raw_source.splitlines(keepends=True))]
         self.definitions = CaseInsensitiveDict((d.name, d) for d in as_tuple(definitions))
         self.pp_info = pp_info
         self.default_scope = scope
+        # Kind symbols of literals, keyed by scope and kind name, since the same
+        # kind is typically used for a large number of literals in a scope
+        self._literal_kinds = {}
 
     @staticmethod
     def warn_or_fail(msg):
@@ -266,13 +357,64 @@ class FParser2IR(GenericVisitor):
             raise NotImplementedError
         warning(msg)
 
+    def get_source_string(self, lines):
+        """
+        Helper method that extracts the source string for a given range of lines.
+
+        Parameters
+        ----------
+        lines : tuple of int
+            The (1-based) first and last line of the range, both inclusive
+
+        Returns
+        -------
+        str
+            The source string with leading and trailing line breaks removed
+        """
+        offsets = self._line_offsets
+        start = offsets[min(max(lines[0] - 1, 0), len(offsets) - 1)]
+        end = offsets[min(lines[1], len(offsets) - 1)]
+        # Move the bounds past any line breaks to avoid copying the string twice
+        raw_source = self.raw_source
+        while start < end and raw_source[end - 1] == '\n':
+            end -= 1
+        while start < end and raw_source[start] == '\n':
+            start += 1
+        return raw_source[start:end]
+
+    def visit_flattened(self, nodes, **kwargs):
+        """
+        Visit the given nodes and flatten the results into a single tuple
+
+        Parameters
+        ----------
+        nodes : iterable
+            The fparser nodes to visit
+
+        Returns
+        -------
+        tuple
+            The flattened results of all visited nodes
+        """
+        visit = self.visit
+        results = []
+        for node in nodes:
+            result = visit(node, **kwargs)
+            # Only tuples and lists need flattening, which may be nested
+            # (e.g., DATA statements inside an implicit part)
+            if isinstance(result, (list, tuple)):
+                results += flatten(result)
+            else:
+                results.append(result)
+        return tuple(results)
+
     def get_source(self, o, source):
         """
         Helper method that builds the source object for the node.
         """
         if o is not None and not isinstance(o, str) and o.item is not None:
             lines = (o.item.span[0], o.item.span[1])
-            string = ''.join(self.raw_source[lines[0] - 1:lines[1]]).strip('\n')
+            string = self.get_source_string(lines)
             source = Source(lines=lines, string=string)
         return source
 
@@ -282,7 +424,7 @@ class FParser2IR(GenericVisitor):
         """
         # Extract source by looking at everything between start_type and end_type nodes
         lines = (start_node.item.span[0], end_node.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
         return source
 
@@ -298,10 +440,19 @@ class FParser2IR(GenericVisitor):
         """
         Generic dispatch method that tries to generate meta-data from source.
         """
-        kwargs['source'] = self.get_source(o, kwargs.get('source'))
-        kwargs['label'] = self.get_label(o)
+        # Equivalent to get_source and get_label but with a single lookup of the
+        # reader item, since this is called for every node in the parse tree
+        item = getattr(o, 'item', None)
+        if item is None:
+            kwargs.setdefault('source', None)
+            kwargs['label'] = None
+        else:
+            lines = (item.span[0], item.span[1])
+            kwargs['source'] = Source(lines=lines, string=self.get_source_string(lines))
+            kwargs['label'] = getattr(item, 'label', None)
         kwargs.setdefault('scope', self.default_scope)
-        return super().visit(o, **kwargs)
+        # Dispatch directly rather than via GenericVisitor.visit to save a call
+        return self.lookup_method(o)(o, **kwargs)
 
     def visit_List(self, o, **kwargs):
         """
@@ -309,7 +460,8 @@ class FParser2IR(GenericVisitor):
 
         ``*_List`` types have their items children
         """
-        return tuple(self.visit(i, **kwargs) for i in o.children)
+        visit = self.visit
+        return tuple([visit(i, **kwargs) for i in o.children])  # pylint: disable=consider-using-generator
 
     def visit_Intrinsic_Stmt(self, o, **kwargs):
         """
@@ -328,7 +480,7 @@ class FParser2IR(GenericVisitor):
         :class:`fparser.two.Fortran2003.Specification_Part` has variable number
         of children making up the body of the spec.
         """
-        children = as_tuple(flatten(self.visit(c, **kwargs) for c in o.children))
+        children = self.visit_flattened(o.children, **kwargs)
         return ir.Section(body=children, source=kwargs.get('source'))
 
     visit_Implicit_Part = visit_List
@@ -463,14 +615,16 @@ class FParser2IR(GenericVisitor):
                 rename_list = {}
             if module is not None:
                 # Import symbol attributes from module, if available
+                imported_attrs = {}
                 for k, v in module.symbol_attrs.items():
                     if k in rename_list:
                         local_name = rename_list[k].name
-                        scope.symbol_attrs[local_name] = v.clone(imported=True, module=module, use_name=k)
+                        imported_attrs[local_name] = v.clone(imported=True, module=module, use_name=k)
                     else:
                         # Need to explicitly reset use_name in case we are importing a symbol
                         # that stems from an import with a rename-list
-                        scope.symbol_attrs[k] = v.clone(imported=True, module=module, use_name=None)
+                        imported_attrs[k] = v.clone(imported=True, module=module, use_name=None)
+                scope.symbol_attrs.update(imported_attrs)
             elif rename_list:
                 # Module not available but some information via rename-list
                 scope.symbol_attrs.update({
@@ -483,28 +637,30 @@ class FParser2IR(GenericVisitor):
             # No rename-list
             rename_list = None
             deferred_type = SymbolAttributes(BasicType.DEFERRED, imported=True)
+            imported_attrs = {}
             if module is None:
                 # Initialize symbol attributes as DEFERRED
                 for s in symbols:
                     if isinstance(s, tuple):  # Renamed symbol
-                        scope.symbol_attrs[s[1].name] = deferred_type.clone(use_name=s[0])
+                        imported_attrs[s[1].name] = deferred_type.clone(use_name=s[0])
                     else:
-                        scope.symbol_attrs[s.name] = deferred_type
+                        imported_attrs[s.name] = deferred_type
             else:
                 # Import symbol attributes from module
                 for s in symbols:
                     if isinstance(s, tuple):  # Renamed symbol
                         _type = module.symbol_attrs.get(s[0], deferred_type)
-                        scope.symbol_attrs[s[1].name] = _type.clone(
+                        imported_attrs[s[1].name] = _type.clone(
                             imported=True, module=module, use_name=s[0]
                         )
                     else:
                         # Need to explicitly reset use_name in case we are importing a symbol
                         # that stems from an import with a rename-list
                         _type = module.symbol_attrs.get(s.name, deferred_type)
-                        scope.symbol_attrs[s.name] = _type.clone(
+                        imported_attrs[s.name] = _type.clone(
                             imported=True, module=module, use_name=None
                         )
+            scope.symbol_attrs.update(imported_attrs)
             symbols = tuple(
                 s[1].rescope(scope=scope) if isinstance(s, tuple) else s.rescope(scope=scope) for s in symbols
             )
@@ -554,29 +710,29 @@ class FParser2IR(GenericVisitor):
         # First, obtain data type and attributes
         _type = self.visit(o.children[0], **kwargs)
         attrs = self.visit(o.children[1], **kwargs) if o.children[1] else ()
-        attrs = dict(attrs)
 
-        # Then, build the common symbol type for all variables
-        _type = _type.clone(**attrs)
+        # Then, collect the properties of the common symbol type for all variables
+        # and create the type only once all of them are final
+        type_kwargs = _type.__dict__.copy()
+        type_kwargs.update(attrs)
 
         # Last, instantiate declared variables
         variables = as_tuple(self.visit(o.children[2], **kwargs))
 
         # DIMENSION is called shape for us
-        if _type.dimension:
-            _type = _type.clone(shape=_type.dimension, dimension=None)
+        if type_kwargs.get('dimension'):
+            type_kwargs['shape'] = type_kwargs.pop('dimension')
             # Attach dimension attribute to variable declaration for uniform
             # representation of variables in declarations
-            variables = as_tuple(v.clone(dimensions=_type.shape) for v in variables)
+            variables = as_tuple(v.clone(dimensions=type_kwargs['shape']) for v in variables)
 
         # Make sure KIND and INITIAL (which can be a name) are in the right scope
         scope = kwargs['scope']
-        if _type.kind is not None:
-            kind = AttachScopesMapper()(_type.kind, scope=scope)
-            _type = _type.clone(kind=kind)
-        if _type.initial is not None:
-            initial = AttachScopesMapper()(_type.initial, scope=scope)
-            _type = _type.clone(initial=initial)
+        if type_kwargs.get('kind') is not None:
+            type_kwargs['kind'] = AttachScopesMapper()(type_kwargs['kind'], scope=scope)
+        if type_kwargs.get('initial') is not None:
+            type_kwargs['initial'] = AttachScopesMapper()(type_kwargs['initial'], scope=scope)
+        _type = SymbolAttributes(**type_kwargs)
 
         # EXTERNAL attribute means this is actually a function or subroutine
         # Since every symbol refers to a different function we have to update the
@@ -599,8 +755,14 @@ class FParser2IR(GenericVisitor):
                 symbols=variables, external=True, source=kwargs.get('source'), label=kwargs.get('label')
             )
 
-        # Update symbol table entries and rescope
-        scope.symbol_attrs.update({var.name: var.type.clone(**_type.__dict__) for var in variables})
+        # Update symbol table entries and rescope. Variables without per-entity
+        # properties (shape, length or initial value) take the common type as is,
+        # since the symbol table stores a copy of it anyway
+        common_attrs = _type.__dict__.keys()
+        scope.symbol_attrs.update({
+            var.name: _type if var.type.__dict__.keys() <= common_attrs else var.type.clone(**_type.__dict__)
+            for var in variables
+        })
         variables = tuple(var.rescope(scope=scope) for var in variables)
 
         return ir.VariableDeclaration(
@@ -815,9 +977,6 @@ class FParser2IR(GenericVisitor):
             lower_bound = self.visit(o.children[0], **kwargs)
         if upper_bound is not None and lower_bound is None:
             return upper_bound
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         return sym.RangeIndex((lower_bound, upper_bound))
 
     visit_Explicit_Shape_Spec_List = visit_List
@@ -1000,9 +1159,6 @@ class FParser2IR(GenericVisitor):
         * the spec: :class:`fparser.two.Fortran2003.Ac_Spec`
         * right bracket (`str`): ``/)`` or ``]``
         """
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         if isinstance(o.children[1], Fortran2003.Ac_Spec):
             values, dtype = self.visit(o.children[1], **kwargs)
         else:
@@ -1037,9 +1193,6 @@ class FParser2IR(GenericVisitor):
         """
         values = self.visit(o.children[0], **kwargs)
         variable, bounds = self.visit(o.children[1], **kwargs)
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         return sym.InlineDo(values, variable, bounds)
 
     def visit_Ac_Implied_Do_Control(self, o, **kwargs):
@@ -1065,7 +1218,8 @@ class FParser2IR(GenericVisitor):
         :class:`fparser.two.Fortran2003.Data_Stmt` has variable number of
         children :class:`fparser.two.Fortran2003.Data_Stmt_Set`.
         """
-        data_statements = tuple(self.visit(data_set, **kwargs) for data_set in o.children)
+        visit = self.visit
+        data_statements = tuple(visit(data_set, **kwargs) for data_set in o.children)
         return data_statements
 
     def visit_Data_Stmt_Set(self, o, **kwargs):
@@ -1127,9 +1281,6 @@ class FParser2IR(GenericVisitor):
         start = self.visit(o.children[0], **kwargs) if o.children[0] is not None else None
         stop = self.visit(o.children[1], **kwargs) if o.children[1] is not None else None
         stride = self.visit(o.children[2], **kwargs) if o.children[2] is not None else None
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         return sym.RangeIndex((start, stop, stride))
 
     def visit_Array_Section(self, o, **kwargs):
@@ -1187,10 +1338,8 @@ class FParser2IR(GenericVisitor):
         * end stmt (:class:`fparser.two.Fortran2003.End_Type_Stmt`)
         """
         # Find start and end of construct
-        derived_type_stmt = get_child(o, Fortran2003.Derived_Type_Stmt)
-        derived_type_stmt_index = o.children.index(derived_type_stmt)
-        end_type_stmt = get_child(o, Fortran2003.End_Type_Stmt)
-        end_type_stmt_index = o.children.index(end_type_stmt)
+        derived_type_stmt, derived_type_stmt_index = get_child_and_index(o, Fortran2003.Derived_Type_Stmt)
+        _, end_type_stmt_index = get_child_and_index(o, Fortran2003.End_Type_Stmt)
 
         # Everything before the construct
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:derived_type_stmt_index])
@@ -1205,10 +1354,12 @@ class FParser2IR(GenericVisitor):
         body = [self.visit(c, **kwargs) for c in o.children[derived_type_stmt_index+1:end_type_stmt_index]]
         body = as_tuple(flatten(body))
 
-        # Infer any additional shape information from `!$loki dimension` pragmas
-        body = attach_pragmas(body, ir.VariableDeclaration)
-        body = process_dimension_pragmas(body)
-        body = detach_pragmas(body, ir.VariableDeclaration)
+        # Infer any additional shape information from `!$loki dimension` pragmas,
+        # skipping the round-trip if the body contains no pragmas at all
+        if FindNodes(ir.Pragma).visit(body):
+            body = attach_pragmas(body, ir.VariableDeclaration)
+            body = process_dimension_pragmas(body)
+            body = detach_pragmas(body, ir.VariableDeclaration)
 
         # Finally: update the typedef with its body and make sure all symbols
         # are in the right scope
@@ -1459,17 +1610,15 @@ class FParser2IR(GenericVisitor):
         * :class:`fparser.two.Fortran2003.End_Associate_Stmt`
         """
         # Find start and end of associate construct
-        assoc_stmt = get_child(o, Fortran2003.Associate_Stmt)
-        assoc_stmt_index = o.children.index(assoc_stmt)
-        end_assoc_stmt = get_child(o, Fortran2003.End_Associate_Stmt)
-        end_assoc_stmt_index = o.children.index(end_assoc_stmt)
+        assoc_stmt, assoc_stmt_index = get_child_and_index(o, Fortran2003.Associate_Stmt)
+        end_assoc_stmt, end_assoc_stmt_index = get_child_and_index(o, Fortran2003.End_Associate_Stmt)
 
         # Everything before the associate statement
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:assoc_stmt_index])
 
         # Extract source object for construct
         lines = (assoc_stmt.item.span[0], end_assoc_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
 
         # Handle the associates
@@ -1482,24 +1631,26 @@ class FParser2IR(GenericVisitor):
         kwargs['scope'] = associate
 
         # Put associate expressions into the right scope and determine type of new symbols
+        attach_scopes = AttachScopesMapper()
+        expression_dimensions = ExpressionDimensionsMapper()
         rescoped_associations = []
         for expr, name in associations:
             # Put symbols in associated expression into the right scope
-            expr = AttachScopesMapper()(expr, scope=parent_scope)
+            expr = attach_scopes(expr, scope=parent_scope)
 
             # Determine type of new names
             if isinstance(expr, (sym.TypedSymbol, sym.MetaSymbol)):
                 # Use the type of the associated variable
                 _type = expr.type.clone(parent=None)
                 if isinstance(expr, sym.Array) and expr.dimensions is not None:
-                    shape = ExpressionDimensionsMapper()(expr)
+                    shape = expression_dimensions(expr)
                     if shape == (sym.IntLiteral(1),):
                         # For a scalar expression, we remove the shape
                         shape = None
                     _type = _type.clone(shape=shape)
             else:
                 # TODO: Handle data type and shape of complex expressions
-                shape = ExpressionDimensionsMapper()(expr)
+                shape = expression_dimensions(expr)
                 if shape == (sym.IntLiteral(1),):
                     # For a scalar expression, we remove the shape
                     shape = None
@@ -1509,7 +1660,7 @@ class FParser2IR(GenericVisitor):
         associations = as_tuple(rescoped_associations)
 
         # The body
-        body = as_tuple(flatten(self.visit(c, **kwargs) for c in o.children[assoc_stmt_index+1:end_assoc_stmt_index]))
+        body = tuple(flatten([self.visit(c, **kwargs) for c in o.children[assoc_stmt_index+1:end_assoc_stmt_index]]))
         associate._update(associations=associations, body=body)
 
         # Everything past the END ASSOCIATE (should be empty)
@@ -1568,17 +1719,15 @@ class FParser2IR(GenericVisitor):
         * the closing :class:`fparser.two.Fortran2003.End_Interface_Stmt`
         """
         # Find start and end of construct
-        interface_stmt = get_child(o, Fortran2003.Interface_Stmt)
-        interface_stmt_index = o.children.index(interface_stmt)
-        end_interface_stmt = get_child(o, Fortran2003.End_Interface_Stmt)
-        end_interface_stmt_index = o.children.index(end_interface_stmt)
+        interface_stmt, interface_stmt_index = get_child_and_index(o, Fortran2003.Interface_Stmt)
+        end_interface_stmt, end_interface_stmt_index = get_child_and_index(o, Fortran2003.End_Interface_Stmt)
 
         # Everything before the construct
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:interface_stmt_index])
 
         # Extract source object for construct
         lines = (interface_stmt.item.span[0], end_interface_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
 
         # The interface spec
@@ -1599,9 +1748,9 @@ class FParser2IR(GenericVisitor):
             spec = spec.rescope(scope=scope)
 
         # Traverse the body and build the object
-        body = as_tuple(flatten(
+        body = tuple(flatten([
             self.visit(c, **kwargs) for c in o.children[interface_stmt_index+1:end_interface_stmt_index]
-        ))
+        ]))
         interface = ir.Interface(
             body=body, abstract=abstract, spec=spec, label=kwargs.get('label'), source=source
         )
@@ -1713,10 +1862,12 @@ class FParser2IR(GenericVisitor):
         * :class:`fparser.two.Fortran2003.End_Subroutine_Stmt` (the final statement)
         """
         # Find start and end of construct
-        subroutine_stmt = get_child(o, (Fortran2003.Subroutine_Stmt, Fortran2003.Function_Stmt))
-        subroutine_stmt_index = o.children.index(subroutine_stmt)
-        end_subroutine_stmt = get_child(o, (Fortran2003.End_Subroutine_Stmt, Fortran2003.End_Function_Stmt))
-        end_subroutine_stmt_index = o.children.index(end_subroutine_stmt)
+        subroutine_stmt, subroutine_stmt_index = get_child_and_index(
+            o, (Fortran2003.Subroutine_Stmt, Fortran2003.Function_Stmt)
+        )
+        end_subroutine_stmt, end_subroutine_stmt_index = get_child_and_index(
+            o, (Fortran2003.End_Subroutine_Stmt, Fortran2003.End_Function_Stmt)
+        )
 
         # Everything before the construct
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:subroutine_stmt_index])
@@ -1730,7 +1881,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (subroutine_stmt.item.span[0], end_subroutine_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
 
         # We make sure the subroutine objects for all member routines are
@@ -2014,10 +2165,8 @@ class FParser2IR(GenericVisitor):
         * the closing :class:`fparser.two.Fortran2003.End_Module_Stmt`
         """
         # Find start and end of construct
-        module_stmt = get_child(o, Fortran2003.Module_Stmt)
-        module_stmt_index = o.children.index(module_stmt)
-        end_module_stmt = get_child(o, Fortran2003.End_Module_Stmt)
-        end_module_stmt_index = o.children.index(end_module_stmt)
+        module_stmt, module_stmt_index = get_child_and_index(o, Fortran2003.Module_Stmt)
+        end_module_stmt, end_module_stmt_index = get_child_and_index(o, Fortran2003.End_Module_Stmt)
 
         # Everything before the construct
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:module_stmt_index])
@@ -2027,7 +2176,7 @@ class FParser2IR(GenericVisitor):
 
         # Extract source object for construct
         lines = (module_stmt.item.span[0], end_module_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
 
         # Instantiate the object
@@ -2141,34 +2290,32 @@ class FParser2IR(GenericVisitor):
         * :class:`fparser.two.Fortran2003.End_If_Stmt`
         """
         # Find start and end of construct
-        if_then_stmt = get_child(o, Fortran2003.If_Then_Stmt)
-        if_then_stmt_index = o.children.index(if_then_stmt)
-        end_if_stmt = get_child(o, Fortran2003.End_If_Stmt)
-        end_if_stmt_index = o.children.index(end_if_stmt)
+        if_then_stmt, if_then_stmt_index = get_child_and_index(o, Fortran2003.If_Then_Stmt)
+        end_if_stmt, end_if_stmt_index = get_child_and_index(o, Fortran2003.End_If_Stmt)
 
         # Everything before the IF statement
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:if_then_stmt_index])
 
-        # Find all branches
-        else_if_stmts = tuple((i, c) for i, c in enumerate(o.children) if isinstance(c, Fortran2003.Else_If_Stmt))
-        if else_if_stmts:
-            else_if_stmt_index, else_if_stmts = zip(*else_if_stmts)
-        else:
-            else_if_stmt_index = ()
-
-        # Note: we need to use here the same method as for else-if because finding Else_Stmt
+        # Find all branches in a single pass over the children
+        # Note: we need to use here the same method for else-if and else because finding Else_Stmt
         # directly and checking its position via o.children.index may give the wrong result.
         # This is because Else_Stmt may erronously compare equal to other node types.
         # See https://github.com/stfc/fparser/issues/400
-        else_stmt = tuple((i, c) for i, c in enumerate(o.children) if isinstance(c, Fortran2003.Else_Stmt))
-        if else_stmt:
-            assert len(else_stmt) == 1
-            else_stmt_index, else_stmt = else_stmt[0]
-        else:
+        else_if_stmt_index, else_if_stmts = [], []
+        else_stmt_index = None
+        for i, c in enumerate(o.children):
+            if isinstance(c, Fortran2003.Else_If_Stmt):
+                else_if_stmt_index += [i]
+                else_if_stmts += [c]
+            elif isinstance(c, Fortran2003.Else_Stmt):
+                assert else_stmt_index is None
+                else_stmt_index = i
+        else_if_stmt_index, else_if_stmts = tuple(else_if_stmt_index), tuple(else_if_stmts)
+        if else_stmt_index is None:
             else_stmt_index = end_if_stmt_index
         conditions = as_tuple(self.visit(c, **kwargs) for c in (if_then_stmt,) + else_if_stmts)
         bodies = tuple(
-            tuple(flatten(as_tuple(self.visit(c, **kwargs) for c in o.children[start+1:stop])))
+            tuple(flatten([self.visit(c, **kwargs) for c in o.children[start+1:stop]]))
             for start, stop in zip(
                     (if_then_stmt_index,) + else_if_stmt_index, else_if_stmt_index + (else_stmt_index,)
             )
@@ -2179,16 +2326,16 @@ class FParser2IR(GenericVisitor):
         sources, labels = [], []
         for conditional in (if_then_stmt,) + else_if_stmts:
             lines = (conditional.item.span[0], end_if_stmt.item.span[1])
-            string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+            string = self.get_source_string(lines)
             sources += [Source(lines=lines, string=string)]
             labels += [self.get_label(conditional)]
 
         # Build IR nodes backwards using else-if branch as else body
         body = bodies[-1]
-        node = ir.Conditional(condition=conditions[-1], body=body, else_body=as_tuple(else_body),
+        node = ir.Conditional(condition=conditions[-1], body=body, else_body=tuple(else_body),
                               inline=False, has_elseif=False, label=labels[-1], source=sources[-1])
         for idx in reversed(range(len(conditions)-1)):
-            node = ir.Conditional(condition=conditions[idx], body=bodies[idx], else_body=as_tuple(node),
+            node = ir.Conditional(condition=conditions[idx], body=bodies[idx], else_body=(node,),
                                   inline=False, has_elseif=True, label=labels[idx], source=sources[idx])
 
         # Update with construct name
@@ -2243,18 +2390,27 @@ class FParser2IR(GenericVisitor):
           corresponding bodies
         * :class:`fparser.two.Fortran2003.End_Select_Stmt`
         """
-        # Find start and end of case construct
-        select_case_stmt = get_child(o, Fortran2003.Select_Case_Stmt)
-        select_case_stmt_index = o.children.index(select_case_stmt)
-        end_select_stmt = get_child(o, Fortran2003.End_Select_Stmt)
-        end_select_stmt_index = o.children.index(end_select_stmt)
+        # Find start and end of case construct and all CASE statements in a single pass
+        select_case_stmt = end_select_stmt = None
+        case_stmts, case_stmt_index = [], []
+        for i, c in enumerate(o.children):
+            if isinstance(c, Fortran2003.Case_Stmt):
+                case_stmts += [c]
+                case_stmt_index += [i]
+            elif isinstance(c, Fortran2003.Select_Case_Stmt):
+                select_case_stmt, select_case_stmt_index = c, i
+            elif isinstance(c, Fortran2003.End_Select_Stmt):
+                end_select_stmt, end_select_stmt_index = c, i
+        if select_case_stmt is None or end_select_stmt is None or not case_stmts:
+            raise ValueError('Incomplete SELECT CASE construct')
+        case_stmts, case_stmt_index = tuple(case_stmts), tuple(case_stmt_index)
 
         # Everything before the SELECT CASE statement
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:select_case_stmt_index])
 
         # Extract source object for construct
         lines = (select_case_stmt.item.span[0], end_select_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
 
         # Handle the SELECT CASE statement
@@ -2262,10 +2418,6 @@ class FParser2IR(GenericVisitor):
         name = select_case_stmt.get_start_name()
         label = self.get_label(select_case_stmt)
 
-        # Find all CASE statements and corresponding bodies
-        case_stmts, case_stmt_index = zip(*[(c, i) for i, c in enumerate(o.children)
-                                            if isinstance(c, Fortran2003.Case_Stmt)])
-
         # Retain any comments between `SELECT CASE` and the first `CASE` statement
         if case_stmt_index[0] > select_case_stmt_index + 1:
             # Our IR doesn't provide a means to store them in the right place, so
@@ -2274,7 +2426,7 @@ class FParser2IR(GenericVisitor):
 
         values = as_tuple(self.visit(c, **kwargs) for c in case_stmts)
         bodies = tuple(
-            as_tuple(flatten(as_tuple(self.visit(c, **kwargs)) for c in o.children[start+1:stop]))
+            tuple(flatten([as_tuple(self.visit(c, **kwargs)) for c in o.children[start+1:stop]]))
             for start, stop in zip(case_stmt_index, case_stmt_index[1:] + (end_select_stmt_index,))
         )
 
@@ -2338,9 +2490,6 @@ class FParser2IR(GenericVisitor):
         """
         start = self.visit(o.children[0], **kwargs) if o.children[0] is not None else None
         stop = self.visit(o.children[1], **kwargs) if o.children[1] is not None else None
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         return sym.RangeIndex((start, stop))
 
     visit_Case_Value_Range_List = visit_List
@@ -2472,8 +2621,7 @@ class FParser2IR(GenericVisitor):
         name = self.visit(o.children[0], **kwargs)
         if o.children[1] is not None:
             arguments = self.visit(o.children[1], **kwargs)
-            kwarguments = tuple(arg for arg in arguments if isinstance(arg, tuple))
-            arguments = tuple(arg for arg in arguments if not isinstance(arg, tuple))
+            arguments, kwarguments = split_arguments(arguments)
         else:
             arguments, kwarguments = (), ()
         return ir.CallStatement(name=name, arguments=arguments, kwarguments=kwarguments,
@@ -2531,8 +2679,7 @@ class FParser2IR(GenericVisitor):
         name = self.visit(o.children[0], **kwargs)
         if o.children[1] is not None:
             arguments = self.visit(o.children[1], **kwargs)
-            kwarguments = tuple(arg for arg in arguments if isinstance(arg, tuple))
-            arguments = tuple(arg for arg in arguments if not isinstance(arg, tuple))
+            arguments, kwarguments = split_arguments(arguments)
         else:
             arguments, kwarguments = (), ()
         return sym.InlineCall(name, parameters=arguments, kw_parameters=kwarguments)
@@ -2542,8 +2689,7 @@ class FParser2IR(GenericVisitor):
         name = self.visit(o.children[0], **kwargs)
         if o.children[1] is not None:
             arguments = self.visit(o.children[1], **kwargs)
-            kwarguments = tuple(arg for arg in arguments if isinstance(arg, tuple))
-            arguments = tuple(arg for arg in arguments if not isinstance(arg, tuple))
+            arguments, kwarguments = split_arguments(arguments)
         else:
             arguments, kwarguments = (), ()
 
@@ -2585,8 +2731,7 @@ class FParser2IR(GenericVisitor):
 
         if o.children[1] is not None:
             arguments = self.visit(o.children[1], **kwargs)
-            kwarguments = tuple(arg for arg in arguments if isinstance(arg, tuple))
-            arguments = tuple(arg for arg in arguments if not isinstance(arg, tuple))
+            arguments, kwarguments = split_arguments(arguments)
         else:
             arguments, kwarguments = (), ()
 
@@ -2613,10 +2758,8 @@ class FParser2IR(GenericVisitor):
         * :class:`fparser.two.Fortran2003.End_Enum_Stmt`
         """
         # Find start end end of construct
-        enum_def_stmt = get_child(o, Fortran2003.Enum_Def_Stmt)
-        enum_def_stmt_index = o.children.index(enum_def_stmt)
-        end_enum_stmt = get_child(o, Fortran2003.End_Enum_Stmt)
-        end_enum_stmt_index = o.children.index(end_enum_stmt)
+        _, enum_def_stmt_index = get_child_and_index(o, Fortran2003.Enum_Def_Stmt)
+        _, end_enum_stmt_index = get_child_and_index(o, Fortran2003.End_Enum_Stmt)
 
         # Everything before the construct
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:enum_def_stmt_index])
@@ -2700,17 +2843,15 @@ class FParser2IR(GenericVisitor):
         * :class:`fparser.two.Fortran2003.End_Where_Stmt`
         """
         # Find start and end of construct
-        where_stmt = get_child(o, Fortran2003.Where_Construct_Stmt)
-        where_stmt_index = o.children.index(where_stmt)
-        end_where_stmt = get_child(o, Fortran2003.End_Where_Stmt)
-        end_where_stmt_index = o.children.index(end_where_stmt)
+        where_stmt, where_stmt_index = get_child_and_index(o, Fortran2003.Where_Construct_Stmt)
+        end_where_stmt, end_where_stmt_index = get_child_and_index(o, Fortran2003.End_Where_Stmt)
 
         # The banter before the construct...
         pre = as_tuple(self.visit(c, **kwargs) for c in o.children[:where_stmt_index])
 
         # Extract source object for construct
         lines = (where_stmt.item.span[0], end_where_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
 
         # Find all ELSEWHERE statements
@@ -2724,9 +2865,10 @@ class FParser2IR(GenericVisitor):
         where_stmts_index = where_stmts_index + (end_where_stmt_index,)
 
         # Handle all cases
-        conditions = tuple(self.visit(c, **kwargs) for c in where_stmts)
+        visit = self.visit
+        conditions = tuple(visit(c, **kwargs) for c in where_stmts)
         bodies = tuple(
-            flatten(as_tuple(self.visit(c, **kwargs) for c in o.children[start+1:stop]))
+            flatten([visit(c, **kwargs) for c in o.children[start+1:stop]])
             for start, stop in zip(where_stmts_index[:-1], where_stmts_index[1:])
         )
 
@@ -2806,7 +2948,8 @@ class FParser2IR(GenericVisitor):
         Universal default for ``Base`` FParser-AST nodes
         """
         self.warn_or_fail(f'No specific handler for node type {o.__class__}')
-        children = tuple(self.visit(c, **kwargs) for c in o.items if c is not None)
+        visit = self.visit
+        children = tuple(visit(c, **kwargs) for c in o.items if c is not None)
         if len(children) == 1:
             return children[0]  # Flatten hierarchy if possible
         return children if len(children) > 0 else None
@@ -2816,7 +2959,8 @@ class FParser2IR(GenericVisitor):
         Universal default for ``BlockBase`` FParser-AST nodes
         """
         self.warn_or_fail(f'No specific handler for node type {o.__class__}')
-        children = tuple(self.visit(c, **kwargs) for c in o.content)
+        visit = self.visit
+        children = tuple(visit(c, **kwargs) for c in o.content)
         children = tuple(c for c in children if c is not None)
         if len(children) == 1:
             return children[0]  # Flatten hierarchy if possible
@@ -2833,7 +2977,12 @@ class FParser2IR(GenericVisitor):
             if kind.isdigit():
                 kind = sym.Literal(value=int(kind))
             else:
-                kind = AttachScopesMapper()(sym.Variable(name=kind), scope=kwargs['scope'])
+                scope = kwargs['scope']
+                # The scope is stored alongside the symbol to keep its id unique
+                key = (id(scope), kind)
+                if key not in self._literal_kinds:
+                    self._literal_kinds[key] = (scope, AttachScopesMapper()(sym.Variable(name=kind), scope=scope))
+                kind = self._literal_kinds[key][1]
             return sym.Literal(value=val, type=_type, kind=kind)
         return sym.Literal(value=val, type=_type)
 
@@ -2886,30 +3035,34 @@ class FParser2IR(GenericVisitor):
 
     def visit_Comment(self, o, **kwargs):
         source = kwargs.get('source', None)
-        match_pragma = self._re_pragma.search(o.tostr())
+        text = o.tostr()
+        # Most comments are not pragmas, so only run the regex on candidates
+        match_pragma = self._re_pragma.match(text) if '!$' in text else None
         if match_pragma:
             # Found pragma, generate this instead
             gd = match_pragma.groupdict()
             return ir.Pragma(keyword=gd['keyword'], content=gd['content'], source=source)
-        return ir.Comment(text=o.tostr(), source=source)
+        return ir.Comment(text=text, source=source)
 
     def visit_Data_Pointer_Object(self, o, **kwargs):
-        v = self.visit(o.items[0], source=kwargs.get('source'), scope=kwargs['scope'])
+        source, scope = kwargs.get('source'), kwargs['scope']
+        v = self.visit(o.items[0], source=source, scope=scope)
         for i in o.items[1:-1]:
             if i == '%':
                 continue
             # Careful not to propagate type or dims here
-            v = self.visit(i, parent=v, source=kwargs.get('source'), scope=kwargs['scope'])
+            v = self.visit(i, parent=v, source=source, scope=scope)
         # Attach types and dims to final leaf variable
         return self.visit(o.items[-1], parent=v, **kwargs)
 
     def visit_Proc_Component_Ref(self, o, **kwargs):
         '''This is the compound object for accessing procedure components of a variable.'''
+        source, scope = kwargs.get('source'), kwargs['scope']
         pname = o.items[0].tostr().lower()
-        v = AttachScopesMapper()(sym.Variable(name=pname), scope=kwargs['scope'])
+        v = AttachScopesMapper()(sym.Variable(name=pname), scope=scope)
         for i in o.items[1:-1]:
             if i != '%':
-                v = self.visit(i, parent=v, source=kwargs.get('source'), scope=kwargs['scope'])
+                v = self.visit(i, parent=v, source=source, scope=scope)
         return self.visit(o.items[-1], parent=v, **kwargs)
 
     def visit_Block_Nonlabel_Do_Construct(self, o, **kwargs):
@@ -2932,7 +3085,7 @@ class FParser2IR(GenericVisitor):
             end_do_stmt = rget_child(o, Fortran2003.Continue_Stmt)
             assert str(end_do_stmt.item.label) == do_stmt.label.string
         lines = (do_stmt.item.span[0], end_do_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
         label = self.get_label(do_stmt)
         construct_name = do_stmt.item.name
@@ -2940,7 +3093,7 @@ class FParser2IR(GenericVisitor):
         variable, bounds = self.visit(do_stmt, **kwargs)
         # Extract and process the loop body
         body_nodes = node_sublist(o.content, do_stmt.__class__, Fortran2003.End_Do_Stmt)
-        body = as_tuple(flatten(self.visit(node, **kwargs) for node in body_nodes))
+        body = self.visit_flattened(body_nodes, **kwargs)
         # Loop label for labeled do constructs
         loop_label = str(do_stmt.items[1]) if isinstance(do_stmt, Fortran2003.Label_Do_Stmt) else None
         # Select loop type
@@ -2968,7 +3121,7 @@ class FParser2IR(GenericVisitor):
             # Scalar logical expression
             return self.visit(o.items[0], **kwargs), None
         variable = self.visit(o.items[1][0], **kwargs)
-        bounds = as_tuple(flatten(self.visit(a, **kwargs) for a in as_tuple(o.items[1][1])))
+        bounds = self.visit_flattened(as_tuple(o.items[1][1]), **kwargs)
         return variable, sym.LoopRange(bounds)
 
     def visit_Assignment_Stmt(self, o, **kwargs):
@@ -3012,11 +3165,21 @@ class FParser2IR(GenericVisitor):
 
     visit_Pointer_Assignment_Stmt = visit_Assignment_Stmt
 
+    _comparison_operators = {
+        '==': '==', '.eq.': '==', '/=': '!=', '.ne.': '!=',
+        '>': '>', '.gt.': '>', '<': '<', '.lt.': '<',
+        '>=': '>=', '.ge.': '>=', '<=': '<=', '.le.': '<='
+    }
+    """
+    Map of Fortran comparison operators (in lower case) to the operator of :any:`Comparison`
+    """
+
     def create_operation(self, op, exprs):
         """
         Construct expressions from individual operations.
         """
         exprs = as_tuple(exprs)
+        op = op.lower()
         if op == '*':
             return sym.Product(exprs)
         if op == '/':
@@ -3031,28 +3194,18 @@ class FParser2IR(GenericVisitor):
             return sym.Product((-1, exprs[0]))
         if op == '**':
             return sym.Power(base=exprs[0], exponent=exprs[1])
-        if op.lower() == '.and.':
+        if op in self._comparison_operators:
+            return sym.Comparison(exprs[0], self._comparison_operators[op], exprs[1])
+        if op == '.and.':
             return sym.LogicalAnd(exprs)
-        if op.lower() == '.or.':
+        if op == '.or.':
             return sym.LogicalOr(exprs)
-        if op.lower() in ('==', '.eq.'):
-            return sym.Comparison(exprs[0], '==', exprs[1])
-        if op.lower() in ('/=', '.ne.'):
-            return sym.Comparison(exprs[0], '!=', exprs[1])
-        if op.lower() in ('>', '.gt.'):
-            return sym.Comparison(exprs[0], '>', exprs[1])
-        if op.lower() in ('<', '.lt.'):
-            return sym.Comparison(exprs[0], '<', exprs[1])
-        if op.lower() in ('>=', '.ge.'):
-            return sym.Comparison(exprs[0], '>=', exprs[1])
-        if op.lower() in ('<=', '.le.'):
-            return sym.Comparison(exprs[0], '<=', exprs[1])
-        if op.lower() == '.not.':
+        if op == '.not.':
             return sym.LogicalNot(exprs[0])
-        if op.lower() == '.eqv.':
+        if op == '.eqv.':
             return sym.LogicalOr((sym.LogicalAnd(exprs),
                                   sym.LogicalNot(sym.LogicalOr(exprs))))
-        if op.lower() == '.neqv.':
+        if op == '.neqv.':
             return sym.LogicalAnd((sym.LogicalNot(sym.LogicalAnd(exprs)),
                                    sym.LogicalOr(exprs)))
         if op == '//':
@@ -3060,9 +3213,6 @@ class FParser2IR(GenericVisitor):
         raise RuntimeError('FParser: Error parsing generic expression')
 
     def visit_Add_Operand(self, o, **kwargs):
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         if len(o.items) > 2:
             # Binary operand
             exprs = [self.visit(o.items[0], **kwargs)]
@@ -3078,17 +3228,11 @@ class FParser2IR(GenericVisitor):
     visit_Equiv_Operand = visit_Add_Operand
 
     def visit_Level_2_Expr(self, o, **kwargs):
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         e1 = self.visit(o.items[0], **kwargs)
         e2 = self.visit(o.items[2], **kwargs)
         return self.create_operation(op=o.items[1], exprs=(e1, e2))
 
     def visit_Level_2_Unary_Expr(self, o, **kwargs):
-        source = kwargs.get('source')
-        if source:
-            source = source.clone_with_string(o.string)
         exprs = as_tuple(self.visit(o.items[1], **kwargs))
         return self.create_operation(op=o.items[0], exprs=exprs)
 
@@ -3097,10 +3241,7 @@ class FParser2IR(GenericVisitor):
     visit_Level_5_Expr = visit_Level_2_Expr
 
     def visit_Parenthesis(self, o, **kwargs):
-        source = kwargs.get('source')
         expression = self.visit(o.items[1], **kwargs)
-        if source:
-            source = source.clone_with_string(o.string)
         if isinstance(expression, sym.Sum):
             expression = ParenthesisedAdd(expression.children)
         if isinstance(expression, sym.Product):
@@ -3164,7 +3305,7 @@ class FParser2IR(GenericVisitor):
         # Extract source by looking at everything between SELECT and END SELECT
         end_select_stmt = rget_child(o, Fortran2003.End_Select_Type_Stmt)
         lines = (select_stmt.item.span[0], end_select_stmt.item.span[1])
-        string = ''.join(self.raw_source[lines[0]-1:lines[1]]).strip('\n')
+        string = self.get_source_string(lines)
         source = Source(lines=lines, string=string)
         label = self.get_label(select_stmt)
         # TODO: Treat this with a dedicated IR node (LOKI-33)
@@ -3173,6 +3314,6 @@ class FParser2IR(GenericVisitor):
     def visit_Nullify_Stmt(self, o, **kwargs):
         if not o.items[1]:
             return ()
-        variables = as_tuple(flatten(self.visit(v, **kwargs) for v in o.items[1].items))
+        variables = self.visit_flattened(o.items[1].items, **kwargs)
         return ir.Nullify(variables=variables, label=kwargs.get('label'),
                           source=kwargs.get('source'))
@@ -138,12 +138,10 @@ class GenericRule:
             cls.check_file(ast, rule_report, config)
 
             # Then recurse for all modules and subroutines in that file
-            if hasattr(ast, 'modules') and ast.modules is not None:
-                for module in ast.modules:
-                    cls.check(module, rule_report, config, **kwargs)
-            if hasattr(ast, 'subroutines') and ast.subroutines is not None:
-                for subroutine in ast.subroutines:
-                    cls.check(subroutine, rule_report, config, **kwargs)
+            for module in getattr(ast, 'modules', None) or ():
+                cls.check(module, rule_report, config, **kwargs)
+            for subroutine in getattr(ast, 'subroutines', None) or ():
+                cls.check(subroutine, rule_report, config, **kwargs)
 
         # Perform checks on module level
         elif isinstance(ast, Module):
@@ -153,9 +151,8 @@ class GenericRule:
             cls.check_module(ast, rule_report, config)
 
             # Then recurse for all subroutines in that module
-            if hasattr(ast, 'subroutines') and ast.subroutines is not None:
-                for subroutine in ast.subroutines:
-                    cls.check(subroutine, rule_report, config, **kwargs)
+            for subroutine in getattr(ast, 'subroutines', None) or ():
+                cls.check(subroutine, rule_report, config, **kwargs)
 
         # Peform checks on subroutine level
         elif isinstance(ast, Subroutine):
@@ -170,9 +167,8 @@ class GenericRule:
             cls.check_subroutine(ast, rule_report, config, targets=targets, **kwargs)
 
             # Recurse for any procedures contained in a subroutine
-            if hasattr(ast, 'members') and ast.members is not None:
-                for member in ast.members:
-                    cls.check(member, rule_report, config, **kwargs)
+            for member in getattr(ast, 'members', None) or ():
+                cls.check(member, rule_report, config, **kwargs)
 
     @classmethod
     def fix_module(cls, module, rule_report, config):
@@ -86,30 +86,26 @@ class Fixer:
         # Fix on source file level
         if isinstance(ast, Sourcefile):
             # Depth-first traversal
-            if hasattr(ast, 'subroutines') and ast.subroutines is not None:
-                for routine in ast.subroutines:
-                    cls.fix_subroutine(routine, reports, config)
-            if hasattr(ast, 'modules') and ast.modules is not None:
-                for module in ast.modules:
-                    cls.fix_module(module, reports, config)
+            for routine in getattr(ast, 'subroutines', None) or ():
+                cls.fix_subroutine(routine, reports, config)
+            for module in getattr(ast, 'modules', None) or ():
+                cls.fix_module(module, reports, config)
 
             cls.fix_sourcefile(ast, reports, config)
 
         # Fix on module level
         elif isinstance(ast, Module):
             # Depth-first traversal
-            if hasattr(ast, 'subroutines') and ast.subroutines is not None:
-                for routine in ast.subroutines:
-                    cls.fix_subroutine(routine, reports, config)
+            for routine in getattr(ast, 'subroutines', None) or ():
+                cls.fix_subroutine(routine, reports, config)
 
             cls.fix_module(ast, reports, config)
 
         # Fix on subroutine level
         elif isinstance(ast, Subroutine):
             # Depth-first traversal
-            if hasattr(ast, 'members') and ast.members is not None:
-                for routine in ast.members:
-                    cls.fix_subroutine(routine, reports, config)
+            for routine in getattr(ast, 'members', None) or ():
+                cls.fix_subroutine(routine, reports, config)
 
             cls.fix_subroutine(ast, reports, config)
 
@@ -133,12 +129,12 @@ def get_filename_from_parent(obj):
         The filename if found, else `None`.
     """
     scope = obj
-    while hasattr(scope, 'parent') and scope.parent:
+    parent = getattr(scope, 'parent', None)
+    while parent:
         # Go up until we are at Sourcefile level
-        scope = scope.parent
-    if hasattr(scope, 'path'):
-        return scope.path
-    return None
+        scope = parent
+        parent = getattr(scope, 'parent', None)
+    return getattr(scope, 'path', None)
 
 
 def get_location_hash(location):
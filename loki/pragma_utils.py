@@ -84,7 +84,7 @@ def get_pragma_parameters(pragma, starts_with=None, only_loki_pragmas=True):
             if not content.lower().startswith(starts_with.lower()):
                 continue
             content = content[len(starts_with):]
-        for match in re.finditer(_get_pragma_parameters_re, content):
+        for match in _get_pragma_parameters_re.finditer(content):
             parameters[match.group('command')].append(match.group('arg'))
     parameters = {k: v if len(v) > 1 else v[0] for k, v in parameters.items()}
     return parameters
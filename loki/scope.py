@@ -154,7 +154,7 @@ class SymbolTable(dict):
         value = self.lookup(key, recursive=False)
         if value is None:
             raise KeyError(key)
-        return value.clone()
+        return value
 
     def get(self, key, default=None):
         """
@@ -168,7 +168,7 @@ class SymbolTable(dict):
             Return this value if :attr:`key` is not found in the table
         """
         value = self.lookup(key, recursive=False)
-        return value.clone() if value is not None else default
+        return value if value is not None else default
 
     def __setitem__(self, key, value):
         assert isinstance(value, SymbolAttributes)
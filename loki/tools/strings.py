@@ -6,7 +6,6 @@
 # nor does it submit to any jurisdiction.
 
 import re
-from copy import deepcopy
 
 from loki.tools.util import is_iterable
 
@@ -120,29 +119,51 @@ class JoinableStringList:
             item_str = str(item)
         chunk_list = re.split(r'(\s|\)(?!%)|\n)', item_str)  # split on ' ', ')' (unless followed by '%') and '\n'
 
-        # First, add as much as possible to the previous line
+        # First, add as much as possible to the previous line. Chunks are collected
+        # in a list and the line width is tracked separately to avoid repeated
+        # string concatenation for very long items
+        cont_width = len(self.cont[0])
+        parts, line_width = [line], len(line)
         next_chunk = 0
         for idx, chunk in enumerate(chunk_list):
-            new_line = line + chunk
-            if len(new_line) + len(self.cont[0]) > self.width:
+            if line_width + len(chunk) + cont_width > self.width:
                 next_chunk = idx
                 break
-            line = new_line
+            parts += [chunk]
+            line_width += len(chunk)
+        line = ''.join(parts)
 
         # Now put the rest on new lines
         lines = []
         if line != self.cont[1]:
             lines += [line + self.cont[0]]
-            line = self.cont[1]
+        parts, line_width = [self.cont[1]], len(self.cont[1])
         for chunk in chunk_list[next_chunk:]:
-            new_line = line + chunk
-            if len(new_line) + len(self.cont[0]) > self.width and line != self.cont[1]:
-                lines += [line + self.cont[0]]
-                line = self.cont[1] + chunk
+            if line_width + len(chunk) + cont_width > self.width and line_width != len(self.cont[1]):
+                lines += [''.join(parts) + self.cont[0]]
+                parts, line_width = [self.cont[1], chunk], len(self.cont[1]) + len(chunk)
             else:
-                line = new_line
+                parts += [chunk]
+                line_width += len(chunk)
 
-        return line, lines
+        return ''.join(parts), lines
+
+    @classmethod
+    def _is_empty(cls, item):
+        """
+        Check if the given item yields an empty string, without converting
+        nested :any:`JoinableStringList` objects to strings.
+
+        :param item: the item to check.
+        :type item: str or `JoinableStringList`
+
+        :rtype: bool
+        """
+        if isinstance(item, str):
+            return not item
+        if isinstance(item, cls):
+            return all(cls._is_empty(i) for i in item.items)
+        return str(item) == ''
 
     def _to_str(self, line='', stop_on_continuation=False):
         """
@@ -162,18 +183,29 @@ class JoinableStringList:
         lines = []
         # Add all items one after another
         for idx, item in enumerate(self.items):
-            if str(item) == '':
+            if self._is_empty(item):
                 # Skip empty items
                 continue
-            sep = self.sep if idx + 1 < len(self.items) else ''
+            if self.sep and idx + 1 < len(self.items):
+                item = item + self.sep
             old_line = line
-            line, _lines = self._add_item_to_line(line, item + sep)
+            line, _lines = self._add_item_to_line(line, item)
             if stop_on_continuation and _lines:
                 return old_line, type(self)(self.items[idx:], sep=self.sep, width=self.width,
                                             cont=self.cont, separable=self.separable)
             lines += _lines
         return ''.join([*lines, line]), None
 
+    def _copy(self):
+        """
+        Create a copy of this object with its own list of items.
+
+        A deep copy is not required here, since concatenation never
+        modifies items in-place but always creates new objects.
+        """
+        return type(self)(self.items, sep=self.sep, width=self.width, cont=self.cont,
+                          separable=self.separable)
+
     def __add__(self, other):
         """
         Concatenate this object and a string or another py:class:`JoinableStringList`.
@@ -185,7 +217,7 @@ class JoinableStringList:
             return type(self)([self, other], sep='', width=self.width, cont=self.cont,
                               separable=False)
         if isinstance(other, str):
-            obj = deepcopy(self)
+            obj = self._copy()
             if obj.items:
                 obj.items[-1] += other
             else:
@@ -201,7 +233,7 @@ class JoinableStringList:
         :type other: str
         """
         if isinstance(other, str):
-            obj = deepcopy(self)
+            obj = self._copy()
             if obj.items:
                 obj.items[0] = other + obj.items[0]
             else:
@@ -149,15 +149,25 @@ def flatten(l, is_leaf=None):
     if is_leaf is None:
         is_leaf = lambda el: False  # pylint: disable=unnecessary-lambda-assignment
     newlist = []
-    for el in l:
-        if is_iterable(el) and not (isinstance(el, (str, bytes)) or is_leaf(el)):
-            for sub in flatten(el, is_leaf):
-                newlist.append(sub)
-        else:
-            newlist.append(el)
+    _flatten_into(newlist, l, is_leaf)
     return newlist
 
 
+def _flatten_into(newlist, l, is_leaf):
+    """
+    Append the flattened items of :data:`l` to :data:`newlist`
+
+    Nested levels are appended directly to the same list instead of
+    being flattened into intermediate lists first.
+    """
+    for el in l:
+        if isinstance(el, (list, tuple)) or (is_iterable(el) and not isinstance(el, (str, bytes))):
+            if not is_leaf(el):
+                _flatten_into(newlist, el, is_leaf)
+                continue
+        newlist.append(el)
+
+
 def filter_ordered(elements, key=None):
     """
     Filter elements in a list while preserving order.
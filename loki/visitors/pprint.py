@@ -43,6 +43,12 @@ class Stringifier(Visitor):
     symgen : optional
         A function handle that accepts a :any:`pymbolic.primitives.Expression`
         and produces a string representation for that.
+
+    Attributes
+    ----------
+    indent : str
+        The indentation string according to the current :attr:`depth`,
+        i.e., ``indent * depth``.
     """
 
     # pylint: disable=arguments-differ
@@ -51,8 +57,9 @@ class Stringifier(Visitor):
                  line_cont=lambda indent: '\n' + indent, symgen=str):
         super().__init__()
 
-        self.depth = depth
         self._indent = indent
+        self._indent_cache = ['']
+        self.depth = depth
         self.linewidth = linewidth
         self.line_cont = line_cont
         self._symgen = symgen
@@ -65,16 +72,27 @@ class Stringifier(Visitor):
         return self._symgen
 
     @property
-    def indent(self):
+    def depth(self):
         """
-        Yield indentation string according to current depth.
+        The current level of indentation.
 
-        Returns
-        -------
-        str
-            A string containing ``indent * depth``.
+        Setting the depth updates :attr:`indent` accordingly.
         """
-        return self._indent * self.depth
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth):
+        self._depth = depth
+
+        # Indentation strings are built once per depth and cached, and the
+        # current one is kept as a plain attribute since it is used for every line
+        if depth <= 0:
+            self.indent = ''
+            return
+        cache = self._indent_cache
+        while len(cache) <= depth:
+            cache.append(cache[-1] + self._indent)
+        self.indent = cache[depth]
 
     @staticmethod
     def join_lines(*lines):
@@ -161,6 +179,26 @@ class Stringifier(Visitor):
             return line + comment
         return line
 
+    def format_token_line(self, token):
+        """
+        Format a line that consists only of a fixed token, such as a closing
+        bracket or keyword.
+
+        This is equivalent to ``format_line(token)`` but bypasses the line
+        wrapping machinery if the line is guaranteed to fit within the line
+        width limit.
+
+        :param str token: the token to be put on that line.
+
+        :return: the string of the current line.
+        :rtype: str
+        """
+        indent = self.indent
+        line = indent + token
+        if len(line) + len(self.line_cont(indent)) <= self.linewidth:
+            return line
+        return self.format_line(token)
+
     def visit_all(self, item, *args, **kwargs):
         """
         Convenience function to call :meth:`visit` for all given arguments.
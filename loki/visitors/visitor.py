@@ -40,12 +40,35 @@ class GenericVisitor:
             pass
     """
 
+    _handler_names = None
+    """
+    Names of the handler methods of a visitor class, which are determined
+    when the first instance of that class is created
+    """
+
     def __init__(self):
-        handlers = {}
+        cls = self.__class__
+        names = cls.__dict__.get('_handler_names')
+        if names is None:
+            names = self._find_handler_names()
+            cls._handler_names = names
+        prefix_len = len("visit_")
+        self._handlers = {name[prefix_len:]: getattr(self, name) for name in names}
+        # Resolved handlers per visitee type for fast dispatch
+        self._dispatch = {}
+
+    def _find_handler_names(self):
+        """
+        Inspect the methods on this instance to find out which handlers are defined.
+
+        Returns
+        -------
+        tuple of str
+            The names of all methods of the form ``visit_Foo``
+        """
+        names = []
         # visit methods are spelt visit_Foo.
         prefix = "visit_"
-        # Inspect the methods on this instance to find out which
-        # handlers are defined.
         for (name, meth) in inspect.getmembers(self, predicate=inspect.ismethod):
             if not name.startswith(prefix):
                 continue
@@ -56,8 +79,8 @@ class GenericVisitor:
             if len(argspec.args) < 2:
                 raise RuntimeError("Visit method signature must be "
                                    "visit_Foo(self, o, [*args, **kwargs])")
-            handlers[name[len(prefix):]] = meth
-        self._handlers = handlers
+            names.append(name)
+        return tuple(names)
 
     default_args = {}
     """
@@ -95,17 +118,24 @@ class GenericVisitor:
         """
         cls = instance.__class__
         try:
-            # Do we have a method handler defined for this type name
-            return self._handlers[cls.__name__]
+            # Have we resolved the handler for this type before
+            return self._dispatch[cls]
         except KeyError:
+            pass
+        # Do we have a method handler defined for this type name
+        entry = self._handlers.get(cls.__name__)
+        if entry is None:
             # No, walk the MRO.
             for klass in cls.mro()[1:]:
                 entry = self._handlers.get(klass.__name__)
                 if entry:
                     # Save it on this type name for faster lookup next time
                     self._handlers[cls.__name__] = entry
-                    return entry
-        raise RuntimeError(f'No handler found for class {cls.__name__}')
+                    break
+            else:
+                raise RuntimeError(f'No handler found for class {cls.__name__}')
+        self._dispatch[cls] = entry
+        return entry
 
     def visit(self, o, *args, **kwargs):
         """
@@ -10,7 +10,10 @@ import pytest
 import numpy as np
 
 from conftest import jit_compile, clean_test, available_frontends
-from loki import OMNI, Subroutine, FindNodes, Loop, Conditional, Node, Intrinsic
+from loki import (
+    OMNI, Subroutine, FindNodes, Loop, Conditional, Node, Intrinsic, Assignment,
+    Variable, Comparison, IntLiteral, fgen
+)
 
 
 @pytest.fixture(scope='module', name='here')
@@ -497,3 +500,31 @@ END FUNCTION FUNC
     assert conditionals[1].body[-1].text.upper() == 'RETURN'
     assert isinstance(conditionals[1].else_body[-1], Intrinsic)
     assert conditionals[1].else_body[-1].text.upper() == 'RETURN'
+
+
+def test_conditional_long_elseif_chain():
+    """
+    Test that long chains of ``ELSE IF`` branches are generated without
+    exhausting the recursion limit.
+    """
+    i = Variable(name='i')
+    j = Variable(name='j')
+    n_branches = 1000
+
+    conditional = None
+    for k in reversed(range(n_branches)):
+        conditional = Conditional(
+            condition=Comparison(i, '==', IntLiteral(k)),
+            body=(Assignment(lhs=j, rhs=IntLiteral(k)),),
+            else_body=(conditional,) if conditional else (Assignment(lhs=j, rhs=IntLiteral(-1)),),
+            has_elseif=conditional is not None
+        )
+
+    code = fgen(conditional).splitlines()
+    assert len(code) == 2 * n_branches + 3
+    assert code[0] == 'IF (i == 0) THEN'
+    assert code[1] == '  j = 0'
+    assert code[2] == 'ELSE IF (i == 1) THEN'
+    assert code[-4] == '  j = 999'
+    assert code[-3:] == ['ELSE', '  j = -1', 'END IF']
+    assert sum(line.startswith('ELSE IF') for line in code) == n_branches - 1
@@ -23,7 +23,7 @@ from loki import (
     FindVariables, FindNodes, SubstituteExpressions, Scope, BasicType, SymbolAttributes,
     parse_fparser_expression, Sum, DerivedType, ProcedureType, ProcedureSymbol,
     DeferredTypeSymbol, Module, HAVE_FP, FindExpressions, LiteralList, FindInlineCalls,
-    AttachScopesMapper, FindTypedSymbols, Reference, Dereference
+    AttachScopesMapper, FindTypedSymbols, Reference, Dereference, ExpressionRetriever
 )
 from loki.expression import symbols
 from loki.tools import gettempdir, filehash
@@ -1034,6 +1034,66 @@ def test_parse_fparser_expression(source, ref):
     assert str(ir) == ref
 
 
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_parse_fparser_expression_scopes():
+    """
+    Test that parsing the same expression repeatedly attaches each result
+    to the given scope.
+    """
+    scope = Scope()
+    scope.symbol_attrs['a'] = SymbolAttributes(BasicType.INTEGER, shape=(symbols.Literal(3),))
+    other_scope = Scope()
+    other_scope.symbol_attrs['a'] = SymbolAttributes(BasicType.REAL)
+
+    expr = parse_fparser_expression('a(i) + 1', scope)
+    assert isinstance(expr.children[0], symbols.Array)
+    assert expr.children[0].scope is scope
+    assert expr.children[0].type.dtype is BasicType.INTEGER
+
+    other_expr = parse_fparser_expression('a(i) + 1', other_scope)
+    assert other_expr.children[0].scope is other_scope
+    assert other_expr.children[0].type.dtype is BasicType.REAL
+    assert expr.children[0].scope is scope
+
+    # Repeated parsing produces equivalent but independent expression trees
+    expr_again = parse_fparser_expression('a(i) + 1', scope)
+    assert expr_again == expr
+    assert expr_again is not expr
+    assert expr_again.children[0].scope is scope
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_parse_fparser_expression_parser_change():
+    """
+    Test that cached parse trees of expressions are discarded when the fparser
+    class hierarchy is replaced by creating another parser
+    """
+    # pylint: disable=import-outside-toplevel
+    from fparser.two.parser import ParserFactory
+    from loki.frontend.fparser import _parse_fparser_primary
+
+    scope = Scope()
+    scope.symbol_attrs['a'] = SymbolAttributes(BasicType.INTEGER, shape=(symbols.Literal(3),))
+    other_scope = Scope()
+    other_scope.symbol_attrs['a'] = SymbolAttributes(BasicType.REAL, shape=(symbols.Literal(3),))
+
+    expr = parse_fparser_expression('a(i) + 1', scope)
+    assert _parse_fparser_primary.cache_info().currsize > 0
+
+    # Creating a Fortran 2003 parser replaces the class hierarchy
+    ParserFactory().create(std='f2003')
+    other_expr = parse_fparser_expression('a(i) + 1', other_scope)
+    assert _parse_fparser_primary.cache_info().currsize == 1
+    assert _parse_fparser_primary.cache_info().hits == 0
+
+    assert other_expr == expr
+    assert isinstance(other_expr.children[0], symbols.Array)
+    assert other_expr.children[0].scope is other_scope
+    assert other_expr.children[0].type.dtype is BasicType.REAL
+    assert expr.children[0].scope is scope
+    assert expr.children[0].type.dtype is BasicType.INTEGER
+
+
 @pytest.mark.parametrize('kwargs,reftype', [
     ({}, symbols.DeferredTypeSymbol),
     ({'type': SymbolAttributes(BasicType.DEFERRED)}, symbols.DeferredTypeSymbol),
@@ -1501,6 +1561,33 @@ end module some_mod
     assert find_ts.visit(source['other_routine'].body) == expected_ts
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_expression_retriever_single_visit(frontend):
+    """
+    Verify that :any:`ExpressionRetriever` visits each node of an expression
+    tree with arrays, casts and ranges exactly once
+    """
+    fcode = """
+subroutine retriever_visit(a, b, n)
+    integer, intent(in) :: n
+    real, intent(inout) :: a(n, n), b(n)
+    integer :: i
+    a(1:n:2, i+1) = real(b(i), kind=8) + a(i, 1)
+end subroutine retriever_visit
+    """.strip()
+
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    assign = FindNodes(Assignment).visit(routine.body)[0]
+
+    retriever = ExpressionRetriever(lambda e: True)
+    exprs = retriever.retrieve((assign.lhs, assign.rhs))
+    assert len(exprs) == len({id(e) for e in exprs})
+
+    assert [str(e) for e in exprs if isinstance(e, symbols.Array)] == ['a(1:n:2, i + 1)', 'b(i)', 'a(i, 1)']
+    assert len([e for e in exprs if isinstance(e, Cast)]) == 1
+    assert [str(e) for e in exprs if isinstance(e, RangeIndex)] == ['1:n:2']
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_expression_c_de_reference(frontend):
     """
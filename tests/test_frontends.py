@@ -26,7 +26,7 @@ from loki import (
     config, REGEX, Sourcefile, Import, RawSource, CallStatement,
     RegexParserClass, ProcedureType, DerivedType, Comment, Pragma,
     PreprocessorDirective, config_override, Section, CommentBlock,
-    Assignment, VariableDeclaration, ProcedureDeclaration
+    Assignment, VariableDeclaration, ProcedureDeclaration, HAVE_FP
 )
 from loki.expression import symbols as sym
 
@@ -1816,3 +1816,35 @@ end subroutine test_inline_comments
     else:
         assert comments[1].text == '! Who said that?'
         assert comments[0].text == comments[2].text == comments[3].text == ''
+
+
+@pytest.mark.skipif(not HAVE_FP, reason='Fparser not available')
+def test_fparser_parser_reuse():
+    """
+    Verify that the fparser class hierarchy is reused across parser calls but
+    set up again if it has been changed in between
+    """
+    # pylint: disable=import-outside-toplevel
+    from fparser.two.parser import ParserFactory
+    from fparser.two import Fortran2003
+
+    fcode = """
+subroutine fparser_parser_reuse(a)
+  real, contiguous, intent(inout) :: a(:)
+  a(:) = 1.
+end subroutine fparser_parser_reuse
+"""
+    routine = Subroutine.from_source(fcode, frontend=FP)
+    subclasses = Fortran2003.Base.subclasses
+    assert routine.variable_map['a'].type.contiguous
+
+    routine = Subroutine.from_source(fcode, frontend=FP)
+    assert Fortran2003.Base.subclasses is subclasses
+    assert routine.variable_map['a'].type.contiguous
+
+    # Creating a Fortran 2003 parser replaces the class hierarchy, which
+    # would not allow the CONTIGUOUS attribute
+    ParserFactory().create(std='f2003')
+    routine = Subroutine.from_source(fcode, frontend=FP)
+    assert Fortran2003.Base.subclasses is not subclasses
+    assert routine.variable_map['a'].type.contiguous
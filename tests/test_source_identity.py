@@ -16,7 +16,7 @@ from pathlib import Path
 import pytest
 from conftest import clean_test, available_frontends
 from loki import (
-  Sourcefile, Subroutine, OMNI, fgen, FindNodes, ir
+  Sourcefile, Subroutine, OMNI, fgen, FindNodes, ir, FortranCodegen
 )
 
 
@@ -238,6 +238,53 @@ END SUBROUTINE CONSERVATIVE
     assert source == fcode
 
 
+@pytest.mark.parametrize('frontend', available_frontends(xfail=[(OMNI, 'This is outright impossible')]))
+def test_codegen_toggle_conservative(frontend):
+    """
+    Test that the conservative mode of :any:`FortranCodegen` can be switched
+    on an existing instance.
+    """
+    fcode = """
+SUBROUTINE TOGGLE_CONSERVATIVE (X, VECTOR)
+  INTEGER, INTENT(IN) :: X
+  REAL, INTENT(INOUT) :: VECTOR(X)
+  INTEGER :: I
+  DO I=1, X
+    VECTOR(I) = 2.0*VECTOR(I)
+  ENDDO
+END SUBROUTINE TOGGLE_CONSERVATIVE
+    """.strip()
+
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    loop = FindNodes(ir.Loop).visit(routine.body)[0]
+
+    codegen = FortranCodegen(conservative=True)
+    assert codegen.visit(loop) == loop.source.string
+
+    codegen.conservative = False
+    assert codegen.visit(loop) == fgen(loop)
+    assert 'ENDDO' not in codegen.visit(loop)
+
+    codegen.conservative = True
+    assert codegen.visit(loop) == loop.source.string
+
+    # Subclasses that override visit are used in either mode
+    class VisitCounter(FortranCodegen):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.count = 0
+
+        def visit(self, o, *args, **kwargs):
+            self.count += 1
+            return super().visit(o, *args, **kwargs)
+
+    for conservative in (True, False):
+        codegen = VisitCounter(conservative=conservative)
+        codegen.visit(loop)
+        assert codegen.count > 0
+
+
 @pytest.mark.parametrize('frontend', available_frontends(xfail=[(OMNI, 'This is outright impossible')]))
 def test_subroutine_simple_fgen(frontend):
     """
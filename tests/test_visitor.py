@@ -16,7 +16,7 @@ from loki import (
     FindNodes, FindVariables, ExpressionFinder,
     ExpressionCallbackMapper, ExpressionRetriever, Stringifier, Transformer,
     NestedTransformer, MaskedTransformer, NestedMaskedTransformer, SubstituteExpressions,
-    is_parent_of, is_child_of, fgen, FindScopes, Intrinsic
+    is_parent_of, is_child_of, fgen, FindScopes, Intrinsic, GenericVisitor, Scalar
 )
 
 
@@ -537,6 +537,16 @@ END MODULE some_mod
     assert Stringifier(indent='#', linewidth=44, line_cont=line_cont).visit(module).strip() == w_ref
 
 
+@pytest.mark.parametrize('depth,linewidth', [(0, 90), (3, 90), (20, 44)])
+def test_stringifier_format_token_line(depth, linewidth):
+    """
+    Test that the fast path for fixed tokens matches :meth:`Stringifier.format_line`.
+    """
+    stringifier = Stringifier(depth=depth, linewidth=linewidth)
+    for token in ('}', 'else:', 'END DO'):
+        assert stringifier.format_token_line(token) == stringifier.format_line(token)
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_transformer_source_invalidation_replace(frontend):
     """
@@ -1253,3 +1263,72 @@ END SUBROUTINE compute_column
         'self': 2, 'self_tuple': 2,  # Loop replaced by itself
         'duplicate': 4  # Loops duplicated
     }[replacement]
+
+
+def test_generic_visitor_handlers():
+    """
+    Test that handler methods are determined once per visitor class and
+    bound to each instance.
+    """
+    class LoopCounter(GenericVisitor):
+        # pylint: disable=unused-argument
+
+        def __init__(self):
+            super().__init__()
+            self.count = 0
+
+        def visit_object(self, o, **kwargs):
+            return None
+
+        def visit_tuple(self, o, **kwargs):
+            for i in o:
+                self.visit(i, **kwargs)
+
+        def visit_Loop(self, o, **kwargs):
+            self.count += 1
+            self.visit(o.body, **kwargs)
+
+    class AssignmentCounter(LoopCounter):
+        # pylint: disable=unused-argument
+
+        def visit_Assignment(self, o, **kwargs):
+            self.count += 1
+
+    body = (
+        Loop(variable=Scalar('i'), bounds=LoopRange((IntLiteral(1), IntLiteral(2))), body=(
+            Assignment(lhs=Scalar('a'), rhs=IntLiteral(1)),
+            Loop(variable=Scalar('j'), bounds=LoopRange((IntLiteral(1), IntLiteral(2))), body=(
+                Assignment(lhs=Scalar('b'), rhs=IntLiteral(1)),
+            ))
+        )),
+    )
+
+    loop_counter = LoopCounter()
+    assert 'Loop' in loop_counter._handlers
+    assert 'Assignment' not in loop_counter._handlers
+    loop_counter.visit(body)
+    assert loop_counter.count == 2
+
+    # A second instance reuses the handler names but binds its own handlers
+    other_counter = LoopCounter()
+    assert 'Loop' in other_counter._handlers
+    assert 'Assignment' not in other_counter._handlers
+    assert other_counter._handlers['Loop'].__self__ is other_counter
+    assert other_counter.count == 0
+
+    # Subclasses determine their own handlers
+    assignment_counter = AssignmentCounter()
+    assert 'Assignment' in assignment_counter._handlers
+    assignment_counter.visit(body)
+    assert assignment_counter.count == 4
+    assert 'Assignment' not in LoopCounter()._handlers
+
+    # Invalid handler signatures are rejected for every instance
+    class InvalidVisitor(GenericVisitor):
+
+        def visit_Loop(self):
+            pass
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            InvalidVisitor()